@@ -10,8 +10,10 @@ from .scheduler import (
     Room,
     StudentGroup,
     TimeSlot,
+    RoomType,
     ScheduledBlock,
-    Scheduler,
+    Schedule,
+    OsteopathyScheduler,
 )
 
 __version__ = "1.0.0"
@@ -21,6 +23,8 @@ __all__ = [
     "Room",
     "StudentGroup",
     "TimeSlot",
+    "RoomType",
     "ScheduledBlock",
-    "Scheduler",
+    "Schedule",
+    "OsteopathyScheduler",
 ]
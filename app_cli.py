@@ -111,6 +111,10 @@ def main_menu():
 
 
 if __name__ == "__main__":
+    # The visualizations render figures in worker processes; in the frozen
+    # app those workers re-launch this executable and must not reach the menu
+    import multiprocessing
+    multiprocessing.freeze_support()
     try:
         main_menu()
     except KeyboardInterrupt:
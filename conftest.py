@@ -0,0 +1,80 @@
+"""
+Shared pytest fixtures for the osteopathy education scheduler tests.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+import random
+from operator import attrgetter
+from types import SimpleNamespace
+
+import pytest
+
+from sample_data import create_sample_data
+from scheduler import OsteopathyScheduler
+from models import RoomType
+
+# (seed, semester_weeks) combinations solved for the cross-variant checks
+SCHEDULE_VARIANTS = [(42, 15), (7, 15), (42, 10)]
+
+# ScheduledBlock fields exposed column-wise on the bundle
+BLOCK_COLUMNS = ("week", "day", "timeslot", "lecturer_id", "room_id",
+                 "student_group_id", "subject_id")
+
+
+def _block_columns(blocks) -> SimpleNamespace:
+    """Transpose scheduled blocks into one tuple per field (struct of arrays)"""
+    rows = map(attrgetter(*BLOCK_COLUMNS), blocks)
+    columns = list(zip(*rows)) or [()] * len(BLOCK_COLUMNS)
+    return SimpleNamespace(**dict(zip(BLOCK_COLUMNS, columns)))
+
+
+def build_schedule_bundle(seed: int = 42, semester_weeks: int = 15) -> SimpleNamespace:
+    """Solve the sample problem once and bundle the schedule with its inputs
+    and the scheduler that produced it"""
+    lecturers, subjects, rooms, student_groups = create_sample_data(seed=seed)
+    
+    scheduler = OsteopathyScheduler(
+        lecturers=lecturers,
+        subjects=subjects,
+        rooms=rooms,
+        student_groups=student_groups,
+        semester_weeks=semester_weeks,
+        rng=random.Random(seed)
+    )
+    schedule = scheduler.create_schedule()
+    columns = _block_columns(schedule.blocks)
+    
+    # Lookup sets shared by the checks so none of them rebuilds its own
+    return SimpleNamespace(
+        scheduler=scheduler,
+        schedule=schedule,
+        columns=columns,
+        lecturers=lecturers,
+        subjects=subjects,
+        rooms=rooms,
+        student_groups=student_groups,
+        priority_lecturer_ids=frozenset(l.id for l in lecturers if l.priority <= 5),
+        theory_subject_ids=frozenset(s.id for s in subjects if s.room_type == RoomType.THEORY),
+        theory_room_ids=frozenset(r.id for r in rooms if r.room_type == RoomType.THEORY),
+        practical_room_ids=frozenset(r.id for r in rooms if r.room_type == RoomType.PRACTICAL),
+        scheduled_subject_ids=frozenset(columns.subject_id),
+        scheduled_lecturer_ids=frozenset(columns.lecturer_id),
+    )
+
+
+@pytest.fixture(scope="session")
+def schedule_bundle():
+    """Sample schedule solved once and shared by every test in the session"""
+    return build_schedule_bundle()
+
+
+@pytest.fixture(scope="session")
+def schedule_variants():
+    """Sample schedules for every SCHEDULE_VARIANTS entry, keyed by (seed, weeks).
+
+    The solves are independent, so they run in a process pool.
+    """
+    seeds, weeks = zip(*SCHEDULE_VARIANTS)
+    with ProcessPoolExecutor(max_workers=min(len(SCHEDULE_VARIANTS), os.cpu_count() or 1)) as pool:
+        bundles = pool.map(build_schedule_bundle, seeds, weeks)
+        return dict(zip(SCHEDULE_VARIANTS, bundles))
@@ -174,9 +174,10 @@ def convert_input_data():
             convert_lecturer_to_pattern(lecturer, weeks)
             converted_count += 1
     
-    # Save updated data
+    # Save updated data (serialize once, then a single write)
+    payload = json.dumps(data, indent=2)
     with open("input_data_pattern.json", "w") as f:
-        json.dump(data, f, indent=2)
+        f.write(payload)
     
     print(f"\n✓ Converted {converted_count} lecturers")
     print(f"✓ Saved to input_data_pattern.json")
@@ -3,35 +3,51 @@ Sample data generator for the osteopathy scheduler.
 Creates realistic test data based on the problem requirements.
 """
 from models import Lecturer, Subject, Room, StudentGroup, TimeSlot, RoomType
-from typing import List, Set, Tuple
+from typing import List, Optional, Set, Tuple
+from functools import lru_cache
+from itertools import product
+import copy
 import random
 
 
-def generate_lecturer_availability(weeks: int, availability_percentage: float = 0.7) -> Set[Tuple[int, int, TimeSlot]]:
+def generate_lecturer_availability(weeks: int, availability_percentage: float = 0.7,
+                                   rng=random) -> Set[Tuple[int, int, TimeSlot]]:
     """
     Generate availability calendar for a lecturer.
     Returns a set of (week, day, timeslot) tuples where lecturer is available.
+    Draws from ``rng`` (the global ``random`` module by default).
     """
-    availability = set()
-    
-    for week in range(weeks):
-        for day in range(1, 6):  # Monday-Friday
-            for timeslot in [TimeSlot.MORNING, TimeSlot.AFTERNOON]:
-                # Randomly make lecturer available based on percentage
-                if random.random() < availability_percentage:
-                    availability.add((week, day, timeslot))
-    
-    return availability
+    # Walk weeks x Monday-Friday x half-days in the same order as before so the
+    # random draws (and therefore seeded sample data) are unchanged
+    slots = product(range(weeks), range(1, 6), (TimeSlot.MORNING, TimeSlot.AFTERNOON))
+    return {slot for slot in slots if rng.random() < availability_percentage}
 
 
-def create_sample_data() -> tuple:
+def create_sample_data(seed: Optional[int] = None) -> tuple:
     """
     Create sample data for the scheduler based on problem requirements:
     - 5 student groups
     - 20 lecturers
     - 15 subjects
     - 10 rooms (9 theory + 1 practical)
+
+    Without a seed, availability is drawn from the global random state.
+    With a seed, the data is built once per seed from a private RNG and
+    every call returns a fresh deep copy, so callers may mutate it freely.
     """
+    if seed is None:
+        return _build_sample_data(random)
+    return copy.deepcopy(_cached_sample_data(seed))
+
+
+@lru_cache(maxsize=None)
+def _cached_sample_data(seed: int) -> tuple:
+    """Memoized sample data for a given seed (never handed out directly)"""
+    return _build_sample_data(random.Random(seed))
+
+
+def _build_sample_data(rng) -> tuple:
+    """Build the sample data, drawing lecturer availability from ``rng``"""
     
     # Create 15 subjects (11 theory + 4 practical A,B,C,D)
     subjects = [
@@ -62,23 +78,23 @@ def create_sample_data() -> tuple:
     # Top 5 priority lecturers with availability calendars
     lecturers.append(Lecturer(
         id="L1", name="Dr. Smith", subject_id="S1", priority=1,
-        availability=generate_lecturer_availability(15, 0.8)
+        availability=generate_lecturer_availability(15, 0.8, rng)
     ))
     lecturers.append(Lecturer(
         id="L2", name="Dr. Johnson", subject_id="S2", priority=2,
-        availability=generate_lecturer_availability(15, 0.75)
+        availability=generate_lecturer_availability(15, 0.75, rng)
     ))
     lecturers.append(Lecturer(
         id="L3", name="Dr. Williams", subject_id="S3", priority=3,
-        availability=generate_lecturer_availability(15, 0.7)
+        availability=generate_lecturer_availability(15, 0.7, rng)
     ))
     lecturers.append(Lecturer(
         id="L4", name="Dr. Brown", subject_id="S4", priority=4,
-        availability=generate_lecturer_availability(15, 0.75)
+        availability=generate_lecturer_availability(15, 0.75, rng)
     ))
     lecturers.append(Lecturer(
         id="L5", name="Dr. Davis", subject_id="S5", priority=5,
-        availability=generate_lecturer_availability(15, 0.8)
+        availability=generate_lecturer_availability(15, 0.8, rng)
     ))
     
     # Remaining 15 lecturers (lower priority, assumed always available)
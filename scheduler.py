@@ -8,6 +8,9 @@ from models import (
 )
 import random
 
+# Practical subjects that share the practical room and are mixed across the semester
+PRACTICAL_SUBJECT_IDS = frozenset({'A', 'B', 'C', 'D'})
+
 
 class OsteopathyScheduler:
     """
@@ -20,13 +23,17 @@ class OsteopathyScheduler:
                  subjects: List[Subject],
                  rooms: List[Room],
                  student_groups: List[StudentGroup],
-                 semester_weeks: int = 15):
+                 semester_weeks: int = 15,
+                 rng: Optional[random.Random] = None):
         self.lecturers = {l.id: l for l in lecturers}
         self.subjects = {s.id: s for s in subjects}
         self.rooms = {r.id: r for r in rooms}
         self.student_groups = {g.id: g for g in student_groups}
         self.semester_weeks = semester_weeks
         self.schedule = Schedule(weeks=semester_weeks)
+        # Source of randomness for mixing practical blocks; defaults to the
+        # global random module so random.seed() keeps working for callers
+        self.rng = rng if rng is not None else random
         
         # Organize lecturers by priority
         self.priority_lecturers = [l for l in lecturers if l.priority <= 5]
@@ -42,7 +49,11 @@ class OsteopathyScheduler:
         1. Schedule top 5 priority lecturers first using their availability
         2. Handle spread subjects with even distribution
         3. Schedule practical subjects (A, B, C, D) mixed across semester
+        
+        Each call starts from an empty schedule, so a scheduler can be reused
+        without rebuilding its lecturer/room lookups.
         """
+        self.schedule = Schedule(weeks=self.semester_weeks)
         print(f"Creating schedule for {self.semester_weeks} weeks...")
         print(f"Priority lecturers: {len(self.priority_lecturers)}")
         
@@ -59,15 +70,16 @@ class OsteopathyScheduler:
         
         # Step 2: Schedule practical subjects (A, B, C, D) mixed across semester
         practical_subjects = [s for s in self.subjects.values() 
-                            if s.room_type == RoomType.PRACTICAL and s.id in ['A', 'B', 'C', 'D']]
+                            if s.room_type == RoomType.PRACTICAL and s.id in PRACTICAL_SUBJECT_IDS]
         
         if practical_subjects:
             print(f"Scheduling {len(practical_subjects)} practical subjects mixed across semester...")
             self._schedule_practical_subjects_mixed(practical_subjects)
         
         # Step 3: Schedule remaining subjects
+        scheduled_subject_ids = {b.subject_id for b in self.schedule.blocks}
         remaining_subjects = [s for s in self.subjects.values() 
-                            if s.id not in [b.subject_id for b in self.schedule.blocks]]
+                            if s.id not in scheduled_subject_ids]
         
         for subject in remaining_subjects:
             lecturer = self._get_lecturer_for_subject(subject.id)
@@ -201,7 +213,7 @@ class OsteopathyScheduler:
                     subject_blocks.append((subject, lecturer, group))
         
         # Shuffle to mix subjects
-        random.shuffle(subject_blocks)
+        self.rng.shuffle(subject_blocks)
         
         # Schedule blocks in mixed order
         scheduled = 0
@@ -84,6 +84,21 @@ def test_pattern_expansion():
     result4 = _expand_availability(list_avail, 15)
     assert len(result4) == 3, f"Expected 3 slots, got {len(result4)}"
     print(f"  ✓ List format backward compatibility: {len(result4)} slots")
+
+    # Test case 5: The weeks expression wins over a leftover "weeks_expanded"
+    # list saved by older versions of the input wizard
+    pattern5 = {
+        "patterns": [
+            {
+                "weeks": "1-4",
+                "weeks_expanded": list(range(1, 11)),
+                "days": {"Mon": ["morning"]}
+            }
+        ]
+    }
+    result5 = _expand_availability(pattern5, 15)
+    assert {w for w, _, _ in result5} == {1, 2, 3, 4}, f"Expected weeks 1-4, got {result5}"
+    print(f"  ✓ Stale pre-expanded weeks ignored: {len(result5)} slots")
     
     print("\n✓ All pattern expansion tests passed!\n")
 
@@ -2,258 +2,144 @@
 """
 Tests for the osteopathy education scheduler.
 Validates that the scheduler meets all requirements.
+
+The sample schedule is solved once per session by the ``schedule_bundle``
+fixture in conftest.py. Each requirement is a ``_check_*`` function run
+against that shared schedule through the parametrized ``test_requirement``.
 """
-import random
-from sample_data import create_sample_data
-from scheduler import OsteopathyScheduler
-from models import RoomType
+from collections import defaultdict
+from itertools import compress
+
+import pytest
 
+from scheduler import PRACTICAL_SUBJECT_IDS
 
-def test_scheduler_basic():
+
+def _check_scheduler_basic(schedule_bundle):
     """Test basic scheduler functionality"""
-    print("Test: Basic scheduler functionality")
-    
-    # Set seed for reproducibility
-    random.seed(42)
-    
-    # Create data
-    lecturers, subjects, rooms, student_groups = create_sample_data()
-    
-    # Create scheduler
-    scheduler = OsteopathyScheduler(
-        lecturers=lecturers,
-        subjects=subjects,
-        rooms=rooms,
-        student_groups=student_groups,
-        semester_weeks=15
-    )
-    
-    # Create schedule
-    schedule = scheduler.create_schedule()
-    
     # Verify blocks were scheduled
-    assert len(schedule.blocks) > 0, "No blocks were scheduled"
-    print(f"  ✓ Scheduled {len(schedule.blocks)} blocks")
-    
-    return True
+    assert len(schedule_bundle.schedule.blocks) > 0, "No blocks were scheduled"
 
 
-def test_priority_lecturers():
+def _check_priority_lecturers(schedule_bundle):
     """Test that top 5 priority lecturers are scheduled"""
-    print("Test: Priority lecturers are scheduled")
-    
-    random.seed(42)
-    lecturers, subjects, rooms, student_groups = create_sample_data()
-    
-    scheduler = OsteopathyScheduler(
-        lecturers=lecturers,
-        subjects=subjects,
-        rooms=rooms,
-        student_groups=student_groups,
-        semester_weeks=15
-    )
-    
-    schedule = scheduler.create_schedule()
-    
     # Check that priority lecturers (1-5) have blocks scheduled
-    priority_lecturer_ids = [l.id for l in lecturers if l.priority <= 5]
-    scheduled_lecturer_ids = set(block.lecturer_id for block in schedule.blocks)
-    
-    priority_scheduled = [lid for lid in priority_lecturer_ids if lid in scheduled_lecturer_ids]
-    
+    priority_scheduled = schedule_bundle.priority_lecturer_ids & schedule_bundle.scheduled_lecturer_ids
+
     assert len(priority_scheduled) == 5, f"Expected 5 priority lecturers, got {len(priority_scheduled)}"
-    print(f"  ✓ All 5 priority lecturers scheduled")
-    
-    return True
 
 
-def test_practical_subjects():
+def _check_practical_subjects(schedule_bundle):
     """Test that practical subjects A, B, C, D are scheduled"""
-    print("Test: Practical subjects A, B, C, D are scheduled")
-    
-    random.seed(42)
-    lecturers, subjects, rooms, student_groups = create_sample_data()
-    
-    scheduler = OsteopathyScheduler(
-        lecturers=lecturers,
-        subjects=subjects,
-        rooms=rooms,
-        student_groups=student_groups,
-        semester_weeks=15
-    )
-    
-    schedule = scheduler.create_schedule()
-    
+    columns = schedule_bundle.columns
+
     # Check practical subjects are scheduled
-    practical_subjects = ['A', 'B', 'C', 'D']
-    scheduled_subjects = set(block.subject_id for block in schedule.blocks)
-    
-    for subj_id in practical_subjects:
-        assert subj_id in scheduled_subjects, f"Practical subject {subj_id} not scheduled"
-    
-    print(f"  ✓ All practical subjects A, B, C, D scheduled")
-    
+    for subj_id in sorted(PRACTICAL_SUBJECT_IDS):
+        assert subj_id in schedule_bundle.scheduled_subject_ids, f"Practical subject {subj_id} not scheduled"
+
     # Verify practical subjects use practical room
-    practical_blocks = [b for b in schedule.blocks if b.subject_id in practical_subjects]
-    practical_room_ids = [r.id for r in rooms if r.room_type == RoomType.PRACTICAL]
-    
-    for block in practical_blocks:
-        assert block.room_id in practical_room_ids, f"Practical block using non-practical room"
-    
-    print(f"  ✓ Practical subjects use practical room")
-    
-    return True
-
-
-def test_spread_subjects():
+    practical_mask = map(PRACTICAL_SUBJECT_IDS.__contains__, columns.subject_id)
+    used_rooms = set(compress(columns.room_id, practical_mask))
+    assert used_rooms <= schedule_bundle.practical_room_ids, \
+        f"Practical blocks using non-practical rooms: {used_rooms - schedule_bundle.practical_room_ids}"
+
+
+def _check_spread_subjects(schedule_bundle):
     """Test that spread subjects are distributed across semester"""
-    print("Test: Spread subjects are distributed")
-    
-    random.seed(42)
-    lecturers, subjects, rooms, student_groups = create_sample_data()
-    
-    scheduler = OsteopathyScheduler(
-        lecturers=lecturers,
-        subjects=subjects,
-        rooms=rooms,
-        student_groups=student_groups,
-        semester_weeks=15
-    )
-    
-    schedule = scheduler.create_schedule()
-    
-    # Find spread subjects
-    spread_subject_ids = [s.id for s in subjects if s.spread]
-    
-    for subj_id in spread_subject_ids:
-        blocks = [b for b in schedule.blocks if b.subject_id == subj_id]
-        
-        if len(blocks) > 1:
-            # Check that blocks are not all in the same week
-            weeks = [b.week for b in blocks]
-            unique_weeks = set(weeks)
-            
-            # For spread subjects, we expect blocks in multiple weeks
-            assert len(unique_weeks) > 1, f"Spread subject {subj_id} not spread across weeks"
-    
-    print(f"  ✓ Spread subjects distributed across multiple weeks")
-    
-    return True
-
-
-def test_no_conflicts():
+    columns = schedule_bundle.columns
+    spread_subject_ids = {s.id for s in schedule_bundle.subjects if s.spread}
+
+    # Group the week column by subject in one pass, keeping spread subjects only
+    weeks_by_subject = defaultdict(list)
+    for subj_id, week in zip(columns.subject_id, columns.week):
+        if subj_id in spread_subject_ids:
+            weeks_by_subject[subj_id].append(week)
+
+    for subj_id, weeks in weeks_by_subject.items():
+        if len(weeks) < 2:
+            continue
+
+        # For spread subjects, we expect blocks in multiple weeks
+        assert len(set(weeks)) > 1, f"Spread subject {subj_id} not spread across weeks"
+
+
+def _first_double_booking(slots, ids):
+    """Return the first slot in which an id is booked twice, or None.
+
+    Occupancy per slot is kept as an int bitmask with one bit per distinct
+    id, so each block costs a single bit test-and-set.
+    """
+    bit_of = {}
+    occupied = {}
+    for slot, id_ in zip(slots, ids):
+        bit = bit_of.setdefault(id_, 1 << len(bit_of))
+        mask = occupied.get(slot, 0)
+        if mask & bit:
+            return slot
+        occupied[slot] = mask | bit
+    return None
+
+
+def _check_no_conflicts(schedule_bundle):
     """Test that there are no scheduling conflicts"""
-    print("Test: No scheduling conflicts")
-    
-    random.seed(42)
-    lecturers, subjects, rooms, student_groups = create_sample_data()
-    
-    scheduler = OsteopathyScheduler(
-        lecturers=lecturers,
-        subjects=subjects,
-        rooms=rooms,
-        student_groups=student_groups,
-        semester_weeks=15
-    )
-    
-    schedule = scheduler.create_schedule()
-    
-    # Check for conflicts
-    for i, block1 in enumerate(schedule.blocks):
-        for block2 in schedule.blocks[i+1:]:
-            # If same time slot, check for conflicts
-            if (block1.week == block2.week and 
-                block1.day == block2.day and 
-                block1.timeslot == block2.timeslot):
-                
-                # No lecturer, room, or group should be double-booked
-                assert block1.lecturer_id != block2.lecturer_id, \
-                    f"Lecturer conflict: {block1.lecturer_id}"
-                assert block1.room_id != block2.room_id, \
-                    f"Room conflict: {block1.room_id}"
-                assert block1.student_group_id != block2.student_group_id, \
-                    f"Student group conflict: {block1.student_group_id}"
-    
-    print(f"  ✓ No scheduling conflicts detected")
-    
-    return True
-
-
-def test_theory_rooms():
+    columns = schedule_bundle.columns
+    slots = list(zip(columns.week, columns.day, columns.timeslot))
+
+    # No lecturer, room, or group should be double-booked
+    clash = _first_double_booking(slots, columns.lecturer_id)
+    assert clash is None, f"Lecturer conflict at {clash}"
+    clash = _first_double_booking(slots, columns.room_id)
+    assert clash is None, f"Room conflict at {clash}"
+    clash = _first_double_booking(slots, columns.student_group_id)
+    assert clash is None, f"Student group conflict at {clash}"
+
+
+def _check_theory_rooms(schedule_bundle):
     """Test that theory subjects use theory rooms"""
-    print("Test: Theory subjects use theory rooms")
-    
-    random.seed(42)
-    lecturers, subjects, rooms, student_groups = create_sample_data()
-    
-    scheduler = OsteopathyScheduler(
-        lecturers=lecturers,
-        subjects=subjects,
-        rooms=rooms,
-        student_groups=student_groups,
-        semester_weeks=15
-    )
-    
-    schedule = scheduler.create_schedule()
-    
-    # Find theory subjects
-    theory_subject_ids = [s.id for s in subjects if s.room_type == RoomType.THEORY]
-    theory_room_ids = [r.id for r in rooms if r.room_type == RoomType.THEORY]
-    
+    columns = schedule_bundle.columns
+    theory_room_ids = schedule_bundle.theory_room_ids
+
     # Check that theory subjects use theory rooms
-    theory_blocks = [b for b in schedule.blocks if b.subject_id in theory_subject_ids]
-    
-    for block in theory_blocks:
-        assert block.room_id in theory_room_ids, \
-            f"Theory block using non-theory room: {block.room_id}"
-    
-    print(f"  ✓ Theory subjects use theory rooms")
-    
-    return True
-
-
-def run_all_tests():
-    """Run all tests"""
-    print("=" * 80)
-    print("RUNNING SCHEDULER TESTS")
-    print("=" * 80)
-    print()
-    
-    tests = [
-        test_scheduler_basic,
-        test_priority_lecturers,
-        test_practical_subjects,
-        test_spread_subjects,
-        test_no_conflicts,
-        test_theory_rooms,
-    ]
-    
-    passed = 0
-    failed = 0
-    
-    for test in tests:
+    theory_mask = map(schedule_bundle.theory_subject_ids.__contains__, columns.subject_id)
+    used_rooms = set(compress(columns.room_id, theory_mask))
+    assert used_rooms <= theory_room_ids, \
+        f"Theory blocks using non-theory rooms: {used_rooms - theory_room_ids}"
+
+
+CHECKS = [
+    ("scheduler_basic", _check_scheduler_basic),
+    ("priority_lecturers", _check_priority_lecturers),
+    ("practical_subjects", _check_practical_subjects),
+    ("spread_subjects", _check_spread_subjects),
+    ("no_conflicts", _check_no_conflicts),
+    ("theory_rooms", _check_theory_rooms),
+]
+
+
+@pytest.mark.parametrize("name,check", CHECKS, ids=[name for name, _ in CHECKS])
+def test_requirement(schedule_bundle, name, check):
+    """Run one requirement check against the shared schedule"""
+    check(schedule_bundle)
+
+
+# Checks that must hold for any seed and semester length, not just the sample
+HARD_CONSTRAINT_CHECKS = [
+    ("no_conflicts", _check_no_conflicts),
+    ("theory_rooms", _check_theory_rooms),
+]
+
+
+@pytest.mark.parametrize("name,check", HARD_CONSTRAINT_CHECKS,
+                         ids=[name for name, _ in HARD_CONSTRAINT_CHECKS])
+def test_hard_constraints_across_variants(schedule_variants, name, check):
+    """Run one hard-constraint check against every (seed, weeks) variant"""
+    for (seed, weeks), bundle in schedule_variants.items():
         try:
-            if test():
-                passed += 1
-            else:
-                failed += 1
-                print(f"  ✗ Test failed")
+            check(bundle)
         except AssertionError as e:
-            failed += 1
-            print(f"  ✗ Test failed: {e}")
-        except Exception as e:
-            failed += 1
-            print(f"  ✗ Test error: {e}")
-        print()
-    
-    print("=" * 80)
-    print(f"RESULTS: {passed} passed, {failed} failed")
-    print("=" * 80)
-    
-    return failed == 0
+            raise AssertionError(f"seed={seed}, weeks={weeks}: {e}") from e
 
 
 if __name__ == "__main__":
     import sys
-    success = run_all_tests()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main(["-q", __file__]))
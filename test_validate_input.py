@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Tests for validate_input: lecturer availability slots must be
+[week, day, timeslot] lists, and anything else gets one clear error.
+"""
+import pytest
+
+from validate_input import validate_data
+
+
+def _data_with_availability(availability):
+    """Minimal valid input with one lecturer whose availability is given"""
+    return {
+        "subjects": [{"id": "S1", "name": "Anatomy", "blocks_required": 2, "room_type": "theory"}],
+        "lecturers": [{"id": "L1", "name": "Dr. Smith", "subject_id": "S1", "priority": 1,
+                       "availability": availability}],
+        "student_groups": [{"id": "G1", "name": "Group 1", "subject_ids": ["S1"]}],
+        "configuration": {"weeks": 15, "days_per_week": 5, "timeslots_per_day": 2,
+                          "timeslots": ["morning", "afternoon"]},
+    }
+
+
+def test_valid_availability():
+    """Well-formed slots within bounds pass"""
+    ok, errors = validate_data(_data_with_availability([[1, 1, "morning"], [3, 5, "afternoon"]]))
+    assert ok, errors
+
+
+@pytest.mark.parametrize("slot", ["1Mo", {"w": 1, "d": 2, "t": 3}, (1, 1, "morning"), [1, 1]],
+                         ids=["string", "dict", "tuple", "short_list"])
+def test_malformed_slot_reports_shape(slot):
+    """A slot that is not a 3-item list gets the shape error, not per-item errors"""
+    ok, errors = validate_data(_data_with_availability([[1, 1, "morning"], slot]))
+    assert not ok
+    assert errors == ["Lecturer L1 availability[1] must be [week, day, timeslot]"]
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main(["-q", __file__]))
@@ -1,15 +1,27 @@
 #!/usr/bin/env python3
 """
 Interactive CLI wizard to create and edit input_data.json for the scheduler.
-- No external dependencies
+- No external dependencies (uses orjson for faster load/save when installed)
 - Validates inputs as you type
 - Safe editing with preview and backup
 """
 import json
 import os
-import shutil
 import sys
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from validate_input import validate_data, print_report
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
+try:
+    import readline  # noqa: F401  (enables line editing/history for input())
+except ImportError:  # e.g. Windows without pyreadline
+    pass
 
 def _set_working_dir_for_bundle():
     """Ensure reads/writes happen next to the script/app bundle.
@@ -29,12 +41,17 @@ _set_working_dir_for_bundle()
 
 INPUT_FILE = "input_data.json"
 
-TYPESLOTS = ["morning", "afternoon"]
-ROOM_TYPES = ["theory", "practical"]
+# Interned so slot/room/day strings read from input or JSON can share
+# these objects (see sys.intern calls below)
+TYPESLOTS = [sys.intern(s) for s in ("morning", "afternoon")]
+ROOM_TYPES = [sys.intern(s) for s in ("theory", "practical")]
 
 
 def load_data(path: str = INPUT_FILE) -> Dict[str, Any]:
     if os.path.exists(path):
+        if orjson is not None:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
         with open(path, "r") as f:
             return json.load(f)
     # default skeleton
@@ -53,18 +70,49 @@ def load_data(path: str = INPUT_FILE) -> Dict[str, Any]:
 
 
 def save_data(data: Dict[str, Any], path: str = INPUT_FILE) -> None:
-    # backup existing
+    # Drop wizard-only cache keys (see lecturer_summary) from the output
+    data = dict(data, lecturers=[{k: v for k, v in l.items() if k != "_summary"}
+                                 for l in data.get("lecturers", [])])
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+    # Write a temp file in one go, then swap it in so the target is never
+    # missing or half-written. The backup is a hardlink to the old file (no
+    # data copied), falling back to a copy where links are unsupported.
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
     if os.path.exists(path):
-        shutil.copyfile(path, path + ".bak")
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+        bak = path + ".bak"
+        if os.path.exists(bak):
+            os.remove(bak)
+        try:
+            os.link(path, bak)
+        except OSError:
+            import shutil  # only needed when hardlinks are unsupported
+            shutil.copyfile(path, bak)
+    os.replace(tmp, path)
     print(f"Saved to {path} (backup at {path}.bak if existed)")
 
 
+def _fast_input(prompt_str: str) -> str:
+    """Plain line read for tight entry loops where line editing adds nothing.
+    Menus keep using input() so readline history/editing stays available.
+    """
+    sys.stdout.write(prompt_str)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
 def prompt(msg: str, default: Any = None, validator=None) -> Any:
     suffix = f" [{default}]" if default is not None else ""
+    text = f"{msg}{suffix}: "
     while True:
-        raw = input(f"{msg}{suffix}: ").strip()
+        raw = input(text).strip()
         if raw == "" and default is not None:
             return default
         val = raw
@@ -78,9 +126,9 @@ def prompt(msg: str, default: Any = None, validator=None) -> Any:
 
 
 def yes_no(msg: str, default: bool = True) -> bool:
-    suffix = " [Y/n]" if default else " [y/N]"
+    text = f"{msg} [Y/n]: " if default else f"{msg} [y/N]: "
     while True:
-        raw = input(f"{msg}{suffix}: ").strip().lower()
+        raw = input(text).strip().lower()
         if raw == "" and default is not None:
             return default
         if raw in ("y", "yes"):
@@ -94,6 +142,9 @@ def v_nonempty(s: str):
     return (len(s) > 0, "Value cannot be empty", s)
 
 
+# Validator factories are cached so repeated prompts reuse one function object
+
+@lru_cache(maxsize=128)
 def v_int(min_v=None, max_v=None):
     def _v(s: str):
         try:
@@ -109,53 +160,94 @@ def v_int(min_v=None, max_v=None):
 
 
 def v_choice(choices: List[str]):
+    return _v_choice(tuple(choices))
+
+
+@lru_cache(maxsize=128)
+def _v_choice(choices: Tuple[str, ...]):
+    allowed = frozenset(choices)
+    err = f"Must be one of: {', '.join(choices)}"
+
     def _v(s: str):
-        if s not in choices:
-            return False, f"Must be one of: {', '.join(choices)}", None
-        return True, "", s
+        if s not in allowed:
+            return False, err, None
+        return True, "", sys.intern(s)
     return _v
 
 
+# Validators for the fixed alphabets/bounds used throughout the menus
+V_ROOMTYPE = v_choice(ROOM_TYPES)
+V_POS_INT = v_int(1)
+
+
+# ---- ID indexes ----
+
+# Per-collection id sets, built lazily from the data on first use and kept in
+# sync by the add_*/delete_* helpers. Each entry remembers the list it was
+# built from so a freshly loaded data dict gets a fresh index.
+_id_indexes: Dict[str, Any] = {}
+
+
+def _id_index(data: Dict[str, Any], kind: str) -> set:
+    items = data[kind]
+    cached = _id_indexes.get(kind)
+    if cached is None or cached[0] is not items:
+        cached = _id_indexes[kind] = (items, {x["id"] for x in items})
+    return cached[1]
+
+
 def list_menu(items: List[str], title: str) -> int:
-    print(f"\n{title}")
-    print("-" * len(title))
-    for i, it in enumerate(items, 1):
-        print(f"  {i}. {it}")
-    print("  0. Back")
+    # Render the whole menu with a single write
+    lines = [f"\n{title}", "-" * len(title)]
+    lines.extend(f"  {i}. {it}" for i, it in enumerate(items, 1))
+    lines.append("  0. Back")
+    sys.stdout.write("\n".join(lines) + "\n")
     choice = prompt("Choose", validator=v_int(0, len(items)))
     return choice
 
 
-# ---- Subjects ----
-
-def subjects_menu(data: Dict[str, Any]):
+def run_crud_menu(data: Dict[str, Any], title: str, entries: List[Tuple[str, Any]]) -> None:
+    """Show a numbered menu of (label, action) entries until Back is chosen.
+    Each action is called with data; choice N dispatches to entries[N-1].
+    """
+    labels = [label for label, _ in entries]
+    actions = (None,) + tuple(action for _, action in entries)
     while True:
-        items = [f"{s['id']}: {s['name']} ({s['room_type']}, blocks={s['blocks_required']}, spread={s.get('spread', False)})" for s in data["subjects"]]
-        ch = list_menu(["Add subject", "Edit subject", "Delete subject", "List subjects"] , "Subjects")
+        ch = list_menu(labels, title)
         if ch == 0:
             return
-        if ch == 1:
-            add_subject(data)
-        elif ch == 2:
-            edit_subject(data)
-        elif ch == 3:
-            delete_subject(data)
-        elif ch == 4:
-            for line in items:
-                print("  -", line)
+        actions[ch](data)
+
+
+# ---- Subjects ----
+
+def subjects_menu(data: Dict[str, Any]):
+    run_crud_menu(data, "Subjects", [
+        ("Add subject", add_subject),
+        ("Edit subject", edit_subject),
+        ("Delete subject", delete_subject),
+        ("List subjects", list_subjects),
+    ])
+
+
+def list_subjects(data: Dict[str, Any]):
+    if data["subjects"]:
+        print("\n".join(f"  - {s['id']}: {s['name']} ({s['room_type']}, blocks={s['blocks_required']}, "
+                        f"spread={s.get('spread', False)})" for s in data["subjects"]))
 
 
 def add_subject(data: Dict[str, Any]):
     print("\nAdd Subject")
     sid = prompt("ID (e.g., S1/A/B)", validator=v_nonempty)
     # ensure unique
-    if any(s["id"] == sid for s in data["subjects"]):
+    if sid in _id_index(data, "subjects"):
         print("  ✗ ID already exists")
         return
     name = prompt("Name", validator=v_nonempty)
-    blocks = prompt("Blocks required", validator=v_int(1))
-    rtype = prompt("Room type", default="theory", validator=v_choice(ROOM_TYPES))
+    blocks = prompt("Blocks required", validator=V_POS_INT)
+    rtype = prompt("Room type", default="theory", validator=V_ROOMTYPE)
     spread = yes_no("Spread across semester?", default=True)
+    _id_index(data, "subjects").add(sid)
     data["subjects"].append({
         "id": sid,
         "name": name,
@@ -171,10 +263,12 @@ def select_by_id(items: List[Dict[str, Any]], kind: str) -> Dict[str, Any]:
         print(f"  No {kind} available")
         return None
     print(f"Available {kind} IDs:")
+    by_id = {}
     for it in items:
         print("  -", it["id"])
+        by_id.setdefault(it["id"], it)
     sid = prompt(f"Enter {kind} ID")
-    found = next((s for s in items if s["id"] == sid), None)
+    found = by_id.get(sid)
     if not found:
         print("  ✗ Not found")
     return found
@@ -186,8 +280,8 @@ def edit_subject(data: Dict[str, Any]):
         return
     print("Editing (press Enter to keep current value)")
     s["name"] = prompt("Name", default=s["name"], validator=v_nonempty)
-    s["blocks_required"] = prompt("Blocks required", default=s["blocks_required"], validator=v_int(1))
-    s["room_type"] = prompt("Room type", default=s["room_type"], validator=v_choice(ROOM_TYPES))
+    s["blocks_required"] = prompt("Blocks required", default=s["blocks_required"], validator=V_POS_INT)
+    s["room_type"] = prompt("Room type", default=s["room_type"], validator=V_ROOMTYPE)
     s["spread"] = yes_no("Spread across semester?", default=bool(s.get("spread", False)))
     print("  ✓ Subject updated")
 
@@ -198,42 +292,42 @@ def delete_subject(data: Dict[str, Any]):
         return
     if yes_no(f"Delete subject {s['id']}?", default=False):
         data["subjects"].remove(s)
+        _id_index(data, "subjects").discard(s["id"])
         print("  ✓ Deleted")
 
 
 # ---- Rooms ----
 
 def rooms_menu(data: Dict[str, Any]):
-    while True:
-        ch = list_menu(["Add room", "Edit room", "Delete room", "List rooms"], "Rooms (Practical Only - Theory Auto-Generated)")
-        if ch == 0:
-            return
-        if ch == 1:
-            add_room(data)
-        elif ch == 2:
-            edit_room(data)
-        elif ch == 3:
-            delete_room(data)
-        elif ch == 4:
-            print("\n  Note: 10 theory rooms (#1-#10, 50 capacity) are automatically generated.")
-            print("  Practical rooms in JSON:")
-            for r in data["rooms"]:
-                print(f"  - {r['id']}: {r['name']} ({r['room_type']}, cap={r['capacity']})")
+    run_crud_menu(data, "Rooms (Practical Only - Theory Auto-Generated)", [
+        ("Add room", add_room),
+        ("Edit room", edit_room),
+        ("Delete room", delete_room),
+        ("List rooms", list_rooms),
+    ])
+
+
+def list_rooms(data: Dict[str, Any]):
+    lines = ["\n  Note: 10 theory rooms (#1-#10, 50 capacity) are automatically generated.",
+             "  Practical rooms in JSON:"]
+    lines.extend(f"  - {r['id']}: {r['name']} ({r['room_type']}, cap={r['capacity']})" for r in data["rooms"])
+    print("\n".join(lines))
 
 
 def add_room(data: Dict[str, Any]):
     print("\nAdd Room (Practical Only)")
     print("  Note: 10 theory rooms are auto-generated. Only add practical rooms here.")
     rid = prompt("ID (e.g., P1)", validator=v_nonempty)
-    if any(r["id"] == rid for r in data["rooms"]):
+    if rid in _id_index(data, "rooms"):
         print("  ✗ ID already exists")
         return
     name = prompt("Name", validator=v_nonempty)
-    rtype = prompt("Room type", default="practical", validator=v_choice(ROOM_TYPES))
+    rtype = prompt("Room type", default="practical", validator=V_ROOMTYPE)
     if rtype == "theory":
         print("  ✗ Theory rooms are auto-generated. Only add practical rooms.")
         return
-    cap = prompt("Capacity", validator=v_int(1))
+    cap = prompt("Capacity", validator=V_POS_INT)
+    _id_index(data, "rooms").add(rid)
     data["rooms"].append({"id": rid, "name": name, "room_type": rtype, "capacity": cap})
     print("  ✓ Room added")
 
@@ -243,8 +337,8 @@ def edit_room(data: Dict[str, Any]):
     if not r:
         return
     r["name"] = prompt("Name", default=r["name"], validator=v_nonempty)
-    r["room_type"] = prompt("Room type", default=r["room_type"], validator=v_choice(ROOM_TYPES))
-    r["capacity"] = prompt("Capacity", default=r["capacity"], validator=v_int(1))
+    r["room_type"] = prompt("Room type", default=r["room_type"], validator=V_ROOMTYPE)
+    r["capacity"] = prompt("Capacity", default=r["capacity"], validator=V_POS_INT)
     print("  ✓ Room updated")
 
 
@@ -254,44 +348,60 @@ def delete_room(data: Dict[str, Any]):
         return
     if yes_no(f"Delete room {r['id']}?", default=False):
         data["rooms"].remove(r)
+        _id_index(data, "rooms").discard(r["id"])
         print("  ✓ Deleted")
 
 
 # ---- Student Groups ----
 
 def groups_menu(data: Dict[str, Any]):
-    while True:
-        ch = list_menu(["Add group", "Edit group", "Delete group", "List groups"], "Student Groups")
-        if ch == 0:
-            return
-        if ch == 1:
-            add_group(data)
-        elif ch == 2:
-            edit_group(data)
-        elif ch == 3:
-            delete_group(data)
-        elif ch == 4:
-            for g in data["student_groups"]:
-                print(f"  - {g['id']}: {g['name']} -> {len(g['subject_ids'])} subjects")
+    run_crud_menu(data, "Student Groups", [
+        ("Add group", add_group),
+        ("Edit group", edit_group),
+        ("Delete group", delete_group),
+        ("List groups", list_groups),
+    ])
+
+
+def list_groups(data: Dict[str, Any]):
+    if data["student_groups"]:
+        print("\n".join(f"  - {g['id']}: {g['name']} -> {len(g['subject_ids'])} subjects"
+                        for g in data["student_groups"]))
 
 
 def add_group(data: Dict[str, Any]):
     print("\nAdd Student Group")
     gid = prompt("ID (e.g., G1)", validator=v_nonempty)
-    if any(g["id"] == gid for g in data["student_groups"]):
+    if gid in _id_index(data, "student_groups"):
         print("  ✗ ID already exists")
         return
     name = prompt("Name", validator=v_nonempty)
-    subject_ids = []
     print("Enter subject IDs this group attends (blank to finish). Existing subjects:")
+    subject_ids = prompt_subject_ids(data)
+    _id_index(data, "student_groups").add(gid)
+    data["student_groups"].append({"id": gid, "name": name, "subject_ids": subject_ids})
+    print("  ✓ Group added")
+
+
+def prompt_subject_ids(data: Dict[str, Any]) -> List[str]:
+    """Read subject IDs until blank, rejecting unknown IDs and skipping repeats."""
     print("  ", ", ".join(s["id"] for s in data["subjects"]))
+    known = _id_index(data, "subjects")
+    subject_ids = []
+    seen = set()
     while True:
         sid = input("  Subject ID: ").strip()
         if not sid:
             break
+        if sid not in known:
+            print("  ✗ Unknown subject ID")
+            continue
+        if sid in seen:
+            print("  ✱ Already added")
+            continue
+        seen.add(sid)
         subject_ids.append(sid)
-    data["student_groups"].append({"id": gid, "name": name, "subject_ids": subject_ids})
-    print("  ✓ Group added")
+    return subject_ids
 
 
 def edit_group(data: Dict[str, Any]):
@@ -300,15 +410,8 @@ def edit_group(data: Dict[str, Any]):
         return
     g["name"] = prompt("Name", default=g["name"], validator=v_nonempty)
     if yes_no("Edit subject IDs?", default=False):
-        subject_ids = []
         print("Enter subject IDs (blank to finish). Existing subjects:")
-        print("  ", ", ".join(s["id"] for s in data["subjects"]))
-        while True:
-            sid = input("  Subject ID: ").strip()
-            if not sid:
-                break
-            subject_ids.append(sid)
-        g["subject_ids"] = subject_ids
+        g["subject_ids"] = prompt_subject_ids(data)
     print("  ✓ Group updated")
 
 
@@ -318,47 +421,46 @@ def delete_group(data: Dict[str, Any]):
         return
     if yes_no(f"Delete group {g['id']}?", default=False):
         data["student_groups"].remove(g)
+        _id_index(data, "student_groups").discard(g["id"])
         print("  ✓ Deleted")
 
 
 # ---- Lecturers ----
 
 def lecturers_menu(data: Dict[str, Any]):
-    while True:
-        ch = list_menu(["Add lecturer", "Edit lecturer", "Delete lecturer", "List lecturers", "Build availability (patterns)", "Convert availability format"], "Lecturers")
-        if ch == 0:
-            return
-        if ch == 1:
-            add_lecturer(data)
-        elif ch == 2:
-            edit_lecturer(data)
-        elif ch == 3:
-            delete_lecturer(data)
-        elif ch == 4:
-            for l in data["lecturers"]:
-                summary = summarize_availability(l.get('availability'))
-                print(f"  - {l['id']}: {l['name']} subj={l['subject_id']} priority={l['priority']} {summary}")
-        elif ch == 5:
-            pattern_builder_global(data)
-        elif ch == 6:
-            convert_availability_global(data)
+    run_crud_menu(data, "Lecturers", [
+        ("Add lecturer", add_lecturer),
+        ("Edit lecturer", edit_lecturer),
+        ("Delete lecturer", delete_lecturer),
+        ("List lecturers", list_lecturers),
+        ("Build availability (patterns)", pattern_builder_global),
+        ("Convert availability format", convert_availability_global),
+    ])
+
+
+def list_lecturers(data: Dict[str, Any]):
+    if data["lecturers"]:
+        print("\n".join(f"  - {l['id']}: {l['name']} subj={l['subject_id']} priority={l['priority']} "
+                        f"{lecturer_summary(l)}"
+                        for l in data["lecturers"]))
 
 
 def add_lecturer(data: Dict[str, Any]):
     print("\nAdd Lecturer")
     lid = prompt("ID (e.g., L1)", validator=v_nonempty)
-    if any(l["id"] == lid for l in data["lecturers"]):
+    if lid in _id_index(data, "lecturers"):
         print("  ✗ ID already exists")
         return
     name = prompt("Name", validator=v_nonempty)
     subject_id = prompt("Subject ID (existing)", validator=v_nonempty)
-    priority = prompt("Priority (1=highest)", validator=v_int(1))
+    priority = prompt("Priority (1=highest)", validator=V_POS_INT)
     availability = []
     if priority <= 5:
         if yes_no("Use pattern-based availability builder?", default=True):
             availability = pattern_builder_single(data)
         elif yes_no("Enter raw slots manually?", default=False):
             availability = prompt_availability(data)
+    _id_index(data, "lecturers").add(lid)
     data["lecturers"].append({
         "id": lid,
         "name": name,
@@ -370,16 +472,17 @@ def add_lecturer(data: Dict[str, Any]):
 
 
 def prompt_availability(data: Dict[str, Any]) -> List[List[Any]]:
-    weeks = data["configuration"]["weeks"]
-    days = data["configuration"]["days_per_week"]
+    cfg = data["configuration"]
+    weeks = cfg["weeks"]
+    days = cfg["days_per_week"]
     print("Enter availability as triples: week(0..), day(1..), timeslot(morning/afternoon). Blank to finish.")
     avail = []
     while True:
-        w = input("  Week (0-based, blank to finish): ").strip()
+        w = _fast_input("  Week (0-based, blank to finish): ").strip()
         if w == "":
             break
-        d = input("  Day (1-5): ").strip()
-        t = input("  Timeslot (morning/afternoon): ").strip().lower()
+        d = _fast_input("  Day (1-5): ").strip()
+        t = _fast_input("  Timeslot (morning/afternoon): ").strip().lower()
         try:
             w_i = int(w)
             d_i = int(d)
@@ -395,7 +498,7 @@ def prompt_availability(data: Dict[str, Any]) -> List[List[Any]]:
         if t not in TYPESLOTS:
             print(f"  ✗ Timeslot must be one of {TYPESLOTS}")
             continue
-        avail.append([w_i, d_i, t])
+        avail.append([w_i, d_i, sys.intern(t)])
     return avail
 
 
@@ -405,36 +508,64 @@ def edit_lecturer(data: Dict[str, Any]):
         return
     l["name"] = prompt("Name", default=l["name"], validator=v_nonempty)
     l["subject_id"] = prompt("Subject ID", default=l["subject_id"], validator=v_nonempty)
-    l["priority"] = prompt("Priority", default=l["priority"], validator=v_int(1))
+    l["priority"] = prompt("Priority", default=l["priority"], validator=V_POS_INT)
     if l["priority"] <= 5 and yes_no("Edit availability?", default=False):
         # Detect format
         current = l.get('availability', [])
-        print(f"Current availability format: {'pattern' if isinstance(current, dict) else 'list'}")
+        is_pattern = type(current) is dict
+        print(f"Current availability format: {'pattern' if is_pattern else 'list'}")
         mode_choice = list_menu(["Pattern builder", "Manual slot list", "Cancel"], "Edit Availability Mode")
         if mode_choice == 1:
-            l["availability"] = pattern_builder_single(data, existing=current if isinstance(current, dict) else None)
+            l["availability"] = pattern_builder_single(data, existing=current if is_pattern else None)
         elif mode_choice == 2:
             l["availability"] = prompt_availability(data)
         else:
             print("  ✱ Availability unchanged")
+        l.pop("_summary", None)
     print("  ✓ Lecturer updated")
 
 # ---- Availability Helpers ----
 
-DAY_CODES = ["Mon","Tue","Wed","Thu","Fri"]
+DAY_CODES = tuple(sys.intern(s) for s in ("Mon", "Tue", "Wed", "Thu", "Fri"))
+DAY_BY_NUMBER = dict(enumerate(DAY_CODES, 1))  # 1 -> "Mon" ... 5 -> "Fri"
+
+# Every lowercase prefix of a day code -> day code; ambiguous prefixes ("t")
+# resolve to the first day, as the old linear startswith scan did
+_DAY_PREFIX: Dict[str, str] = {}
+for _d in DAY_CODES:
+    for _i in range(len(_d) + 1):
+        _DAY_PREFIX.setdefault(_d[:_i].lower(), _d)
+del _d, _i
+
+# Pattern-builder selection bits: 5 days x 2 half-days packed into one int
+_SLOT_BIT = {(d, slot): 1 << (i * 2 + j)
+             for i, d in enumerate(DAY_CODES) for j, slot in enumerate(TYPESLOTS)}
+_ALL_SLOTS_MASK = (1 << len(_SLOT_BIT)) - 1
+
+V_DAY = v_choice(DAY_CODES)
 
 def summarize_availability(avail) -> str:
     if not avail:
         return "avail=0 slots"
-    if isinstance(avail, list):
+    # Availability comes straight from JSON, so exact type checks suffice
+    if type(avail) is list:
         return f"avail={len(avail)} slots (list)"
-    if isinstance(avail, dict):
+    if type(avail) is dict:
         patterns = len(avail.get('patterns', []) or [])
         exceptions = len(avail.get('exceptions', []) or [])
         blackouts = len(avail.get('blackouts', []) or [])
         return f"patterns={patterns}, exceptions={exceptions}, blackouts={blackouts}"
     return "avail=?"
 
+def lecturer_summary(l: Dict[str, Any]) -> str:
+    """summarize_availability for a lecturer, cached in l["_summary"].
+    Code that replaces or edits l["availability"] must pop the cached value.
+    """
+    summary = l.get("_summary")
+    if summary is None:
+        summary = l["_summary"] = summarize_availability(l.get("availability"))
+    return summary
+
 def pattern_builder_single(data: Dict[str, Any], existing: Dict[str, Any] = None) -> Dict[str, Any]:
     weeks_total = data["configuration"]["weeks"]
     print(f"\nPattern Availability Builder (weeks 1..{weeks_total})")
@@ -445,22 +576,20 @@ def pattern_builder_single(data: Dict[str, Any], existing: Dict[str, Any] = None
     while True:
         print("\nAdd / Edit a Pattern")
         weeks_expr = prompt("Weeks expression (e.g. 1-5,7,10-12)", default=f"1-{weeks_total}")
-        # Initialize empty selection grid
-        selection = {d: {"morning": False, "afternoon": False} for d in DAY_CODES}
+        # Empty selection grid: one bit per (day, slot), see _SLOT_BIT
+        sel_mask = 0
         # Interactive toggling loop
         print("Toggle slots. Commands: 'mon m', 'tue a', 'wed both', 'all', 'done', 'show'.")
         while True:
-            cmd = input("  slot> ").strip().lower()
+            cmd = _fast_input("  slot> ").strip().lower()
             if cmd in ("done", "finish"):
                 break
             if cmd == "show":
-                _print_selection(selection)
+                _print_selection(sel_mask)
                 continue
             if cmd == "all":
-                for d in DAY_CODES:
-                    selection[d]["morning"] = True
-                    selection[d]["afternoon"] = True
-                _print_selection(selection)
+                sel_mask = _ALL_SLOTS_MASK
+                _print_selection(sel_mask)
                 continue
             parts = cmd.split()
             if not parts:
@@ -472,20 +601,19 @@ def pattern_builder_single(data: Dict[str, Any], existing: Dict[str, Any] = None
                 print("  ✗ Unknown day code")
                 continue
             if slot_part in (None, "both"):
-                selection[day_match]["morning"] = not selection[day_match]["morning"]
-                selection[day_match]["afternoon"] = not selection[day_match]["afternoon"]
+                sel_mask ^= _SLOT_BIT[(day_match, "morning")] | _SLOT_BIT[(day_match, "afternoon")]
             elif slot_part in ("m", "morning"):
-                selection[day_match]["morning"] = not selection[day_match]["morning"]
+                sel_mask ^= _SLOT_BIT[(day_match, "morning")]
             elif slot_part in ("a", "afternoon"):
-                selection[day_match]["afternoon"] = not selection[day_match]["afternoon"]
+                sel_mask ^= _SLOT_BIT[(day_match, "afternoon")]
             else:
                 print("  ✗ Unknown slot; use morning/m or afternoon/a/both")
                 continue
-            _print_selection(selection)
+            _print_selection(sel_mask)
         # Build pattern days map
         days_map = {}
         for d in DAY_CODES:
-            slots = [s for s, v in selection[d].items() if v]
+            slots = [s for s in TYPESLOTS if sel_mask & _SLOT_BIT[(d, s)]]
             if slots:
                 days_map[d] = slots
         availability["patterns"].append({"weeks": weeks_expr, "days": days_map})
@@ -497,7 +625,7 @@ def pattern_builder_single(data: Dict[str, Any], existing: Dict[str, Any] = None
     if yes_no("Add exceptions (specific adds/removes)?", default=False):
         while True:
             week = prompt("Exception week", validator=v_int(1, weeks_total))
-            day = prompt("Day (Mon/Tue/...)", validator=v_choice(DAY_CODES))
+            day = prompt("Day (Mon/Tue/...)", validator=V_DAY)
             action = prompt("Action (remove/add)", validator=v_choice(["remove","add"]))
             slots_raw = prompt("Slots comma list (morning,afternoon)", default="morning")
             slots = [s.strip() for s in slots_raw.split(',') if s.strip() in TYPESLOTS]
@@ -521,18 +649,15 @@ def pattern_builder_single(data: Dict[str, Any], existing: Dict[str, Any] = None
     return availability
 
 def _match_day(token: str) -> str:
-    token = token.lower()
-    for d in DAY_CODES:
-        if d.lower().startswith(token):
-            return d
-    return None
+    return _DAY_PREFIX.get(token.lower())
 
-def _print_selection(selection: Dict[str, Dict[str,bool]]):
-    print("    Day       Morning Afternoon")
+def _print_selection(sel_mask: int):
+    lines = ["    Day       Morning Afternoon"]
     for d in DAY_CODES:
-        m = '✓' if selection[d]['morning'] else '·'
-        a = '✓' if selection[d]['afternoon'] else '·'
-        print(f"    {d:<3}       {m:^7} {a:^9}")
+        m = '✓' if sel_mask & _SLOT_BIT[(d, "morning")] else '·'
+        a = '✓' if sel_mask & _SLOT_BIT[(d, "afternoon")] else '·'
+        lines.append(f"    {d:<3}       {m:^7} {a:^9}")
+    print("\n".join(lines))
 
 def pattern_builder_global(data: Dict[str, Any]):
     print("\nAssign patterns to multiple lecturers (priority <=5).")
@@ -542,36 +667,43 @@ def pattern_builder_global(data: Dict[str, Any]):
         return
     print("Priority lecturers:")
     for l in targets:
-        print(f"  - {l['id']}: {l['name']} ({summarize_availability(l.get('availability'))})")
+        print(f"  - {l['id']}: {l['name']} ({lecturer_summary(l)})")
     if not yes_no("Proceed building a pattern and apply to all (append)?", default=False):
         return
     pattern_avail = pattern_builder_single(data)
+    p_pat, p_exc, p_bl = pattern_avail['patterns'], pattern_avail['exceptions'], pattern_avail['blackouts']
     for l in targets:
+        l.pop("_summary", None)
         existing = l.get('availability')
-        if isinstance(existing, dict):
-            existing['patterns'].extend(pattern_avail['patterns'])
-            existing['exceptions'].extend(pattern_avail['exceptions'])
-            existing['blackouts'].extend(pattern_avail['blackouts'])
+        if type(existing) is dict:
+            existing['patterns'] += p_pat
+            existing['exceptions'] += p_exc
+            existing['blackouts'] += p_bl
         else:
-            l['availability'] = pattern_avail
+            # Fresh lists per lecturer so a later append to one is not shared
+            l['availability'] = {"patterns": p_pat[:], "exceptions": p_exc[:], "blackouts": p_bl[:]}
     print("  ✓ Pattern applied to all priority lecturers")
 
 def convert_availability_global(data: Dict[str, Any]):
     print("\nConvert list-based availability to pattern schema.")
+    weeks_total = data['configuration']['weeks']
+    weeks_expr = f"1-{weeks_total}"
     for l in data['lecturers']:
         avail = l.get('availability')
-        if isinstance(avail, list) and avail:
-            # Group by day/slot ignoring weeks for a base pattern
-            weeks_total = data['configuration']['weeks']
-            weeks_expr = f"1-{weeks_total}"
-            day_slot = {d: set() for d in DAY_CODES}
-            for w, d, slot in avail:
-                # d is numeric day (1-5)
-                day_name = DAY_CODES[d - 1] if 1 <= d <= 5 else None
-                if day_name:
-                    day_slot[day_name].add(slot)
-            days_map = {d: sorted(slots) for d, slots in day_slot.items() if slots}
+        if type(avail) is list and avail:
+            # Group by day/slot ignoring weeks for a base pattern, OR-ing the
+            # triples into the same day x slot bitmask the pattern builder uses
+            mask = 0
+            for _, d, slot in avail:
+                # d is numeric day (1-5); unknown days/slots contribute no bit
+                mask |= _SLOT_BIT.get((DAY_BY_NUMBER.get(d), slot), 0)
+            days_map = {}
+            for d in DAY_CODES:
+                slots = [s for s in TYPESLOTS if mask & _SLOT_BIT[(d, s)]]
+                if slots:
+                    days_map[d] = slots
             l['availability'] = {"patterns": [{"weeks": weeks_expr, "days": days_map}], "exceptions": [], "blackouts": []}
+            l.pop("_summary", None)
             print(f"  ✓ Converted lecturer {l['id']} -> pattern format")
     print("Conversion complete.")
 
@@ -582,6 +714,7 @@ def delete_lecturer(data: Dict[str, Any]):
         return
     if yes_no(f"Delete lecturer {l['id']}?", default=False):
         data["lecturers"].remove(l)
+        _id_index(data, "lecturers").discard(l["id"])
         print("  ✓ Deleted")
 
 
@@ -590,9 +723,9 @@ def delete_lecturer(data: Dict[str, Any]):
 def config_menu(data: Dict[str, Any]):
     cfg = data["configuration"]
     print("\nConfiguration (press Enter to keep current value)")
-    cfg["weeks"] = prompt("Weeks (semester length)", default=cfg["weeks"], validator=v_int(1))
+    cfg["weeks"] = prompt("Weeks (semester length)", default=cfg["weeks"], validator=V_POS_INT)
     cfg["days_per_week"] = prompt("Days per week", default=cfg["days_per_week"], validator=v_int(1, 7))
-    cfg["timeslots_per_day"] = prompt("Timeslots per day", default=cfg["timeslots_per_day"], validator=v_int(1))
+    cfg["timeslots_per_day"] = prompt("Timeslots per day", default=cfg["timeslots_per_day"], validator=V_POS_INT)
     # fixed timeslots for now
     print(f"Timeslots supported: {', '.join(TYPESLOTS)}")
     print("  ✓ Configuration updated")
@@ -600,19 +733,25 @@ def config_menu(data: Dict[str, Any]):
 
 # ---- Main Menu ----
 
+# Main menu rendered once at import and written in a single call per redraw
+MAIN_MENU_TEXT = "\n".join([
+    "\nOsteopathy Scheduler - Input Wizard",
+    "=" * 40,
+    "1) Subjects",
+    "2) Rooms (Practical only - 10 theory auto-generated)",
+    "3) Student Groups",
+    "4) Lecturers",
+    "5) Configuration",
+    "6) Validate and Save",
+    "7) Save without validation",
+    "0) Exit",
+]) + "\n"
+
+
 def main_menu():
     data = load_data()
     while True:
-        print("\nOsteopathy Scheduler - Input Wizard")
-        print("=" * 40)
-        print("1) Subjects")
-        print("2) Rooms (Practical only - 10 theory auto-generated)")
-        print("3) Student Groups")
-        print("4) Lecturers")
-        print("5) Configuration")
-        print("6) Validate and Save")
-        print("7) Save without validation")
-        print("0) Exit")
+        sys.stdout.write(MAIN_MENU_TEXT)
         choice = prompt("Select option", validator=v_int(0,7))
         if choice == 0:
             break
@@ -627,7 +766,6 @@ def main_menu():
         elif choice == 5:
             config_menu(data)
         elif choice == 6:
-            from validate_input import validate_data, print_report
             ok, report = validate_data(data)
             print_report(ok, report)
             if ok and yes_no("Save changes?", default=True):
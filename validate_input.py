@@ -2,124 +2,171 @@
 """
 Validation utilities for input_data.json.
 Checks referential integrity and value ranges.
+
+Usage: python validate_input.py [file.json ...]  (default: input_data.json)
+
+All files are validated in one process. The code is stdlib-only and the
+availability loop keeps to plain locals and stable types, so it JITs well;
+for batch validation of many/large files use
+`pypy3 validate_input.py file1.json file2.json ...`.
 """
 import json
+import sys
+from collections import Counter
 from typing import Any, Dict, List, Tuple
 
-ALLOWED_TIMESLOTS = {"morning", "afternoon"}
-ALLOWED_ROOM_TYPES = {"theory", "practical"}
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
+ALLOWED_TIMESLOTS = frozenset({"morning", "afternoon"})
+ALLOWED_ROOM_TYPES = frozenset({"theory", "practical"})
 
 
 def load_json(path: str = "input_data.json") -> Dict[str, Any]:
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     with open(path, "r") as f:
         return json.load(f)
 
 
-def validate_data(data: Dict[str, Any]) -> Tuple[bool, List[str]]:
-    errors: List[str] = []
-
-    # Basic presence (rooms key is optional now as they're auto-generated)
-    for key in ["subjects", "lecturers", "student_groups", "configuration"]:
-        if key not in data:
-            errors.append(f"Missing top-level key: {key}")
-            return False, errors
-
-    # Collect ids
-    subject_ids = set()
-    room_ids = set()
-    lecturer_ids = set()
-    group_ids = set()
-
-    # Subjects
-    for s in data["subjects"]:
-        sid = s.get("id")
-        if not sid:
-            errors.append("Subject with missing id")
-            continue
-        if sid in subject_ids:
-            errors.append(f"Duplicate subject id: {sid}")
-        subject_ids.add(sid)
-        if s.get("room_type") not in ALLOWED_ROOM_TYPES:
-            errors.append(f"Subject {sid} invalid room_type: {s.get('room_type')}")
-        if not isinstance(s.get("blocks_required"), int) or s.get("blocks_required", 0) <= 0:
-            errors.append(f"Subject {sid} blocks_required must be positive int")
-
-    # Rooms - all rooms (10 theory + 1 practical) are auto-generated, no rooms in JSON needed
-    if "rooms" in data and data["rooms"]:
-        errors.append("Rooms are auto-generated (10 theory + 1 practical), remove 'rooms' from JSON")
-
-    # Groups
-    for g in data["student_groups"]:
-        gid = g.get("id")
-        if not gid:
-            errors.append("Group with missing id")
-            continue
-        if gid in group_ids:
-            errors.append(f"Duplicate group id: {gid}")
-        group_ids.add(gid)
-        for sid in g.get("subject_ids", []):
-            if sid not in subject_ids:
-                errors.append(f"Group {gid} references unknown subject id: {sid}")
-
-    # Lecturers
-    for l in data["lecturers"]:
-        lid = l.get("id")
-        if not lid:
-            errors.append("Lecturer with missing id")
-            continue
-        if lid in lecturer_ids:
-            errors.append(f"Duplicate lecturer id: {lid}")
-        lecturer_ids.add(lid)
-        subj = l.get("subject_id")
-        if subj not in subject_ids:
-            errors.append(f"Lecturer {lid} references unknown subject id: {subj}")
-        prio = l.get("priority")
-        if not isinstance(prio, int) or prio <= 0:
-            errors.append(f"Lecturer {lid} priority must be positive int")
-        # availability
-        for idx, slot in enumerate(l.get("availability", [])):
-            if not (isinstance(slot, list) and len(slot) == 3):
-                errors.append(f"Lecturer {lid} availability[{idx}] must be [week, day, timeslot]")
+_INT_ONLY = {int}
+_LIST_ONLY = {list}
+
+
+def _slots_in_bounds(avail, weeks_range: range, days_range: range, timeslots) -> bool:
+    """True if every slot is a 3-item [week, day, timeslot] list within bounds.
+
+    The slots are transposed into week/day/timeslot columns and checked with
+    built-in reductions (type sets, min/max, issuperset) instead of per-slot
+    Python branches. False means "not provably valid": the caller then walks
+    the slots one by one to report exactly which are wrong.
+    """
+    try:
+        if set(map(type, avail)) != _LIST_ONLY or set(map(len, avail)) != {3}:
+            return False
+        weeks, days, slots = zip(*avail)
+    except (TypeError, ValueError):
+        return False
+    return (set(map(type, weeks)) == _INT_ONLY and set(map(type, days)) == _INT_ONLY
+            and min(weeks) in weeks_range and max(weeks) in weeks_range
+            and min(days) in days_range and max(days) in days_range
+            and timeslots.issuperset(slots))
+
+
+def make_validator(allowed_timeslots=ALLOWED_TIMESLOTS, allowed_room_types=ALLOWED_ROOM_TYPES):
+    """Build a validate(data) -> (ok, errors) function with the allowed
+    timeslots and room types frozen into it once, so repeated validations
+    (e.g. several save attempts in the wizard) reuse the same callable.
+    """
+    timeslots = frozenset(allowed_timeslots)
+    room_types = frozenset(allowed_room_types)
+
+    def validate(data: Dict[str, Any]) -> Tuple[bool, List[str]]:
+        errors: List[str] = []
+
+        # Basic presence (rooms key is optional now as they're auto-generated)
+        for key in ["subjects", "lecturers", "student_groups", "configuration"]:
+            if key not in data:
+                errors.append(f"Missing top-level key: {key}")
+                return False, errors
+
+        # Duplicate ids, counted once per kind
+        for key, kind in (("subjects", "subject"), ("student_groups", "group"), ("lecturers", "lecturer")):
+            counts = Counter(x.get("id") for x in data[key])
+            errors.extend(f"Duplicate {kind} id: {xid}" for xid, n in counts.items() if xid and n > 1)
+
+        # Subjects
+        subject_ids = set()
+        for s in data["subjects"]:
+            sid = s.get("id")
+            if not sid:
+                errors.append("Subject with missing id")
                 continue
-            w, d, t = slot
-            if not isinstance(w, int) or w < 0:
-                errors.append(f"Lecturer {lid} availability[{idx}] invalid week: {w}")
-            if not isinstance(d, int) or d < 1:
-                errors.append(f"Lecturer {lid} availability[{idx}] invalid day: {d}")
-            if t not in ALLOWED_TIMESLOTS:
-                errors.append(f"Lecturer {lid} availability[{idx}] invalid timeslot: {t}")
-
-    # Configuration
-    cfg = data["configuration"]
-    weeks = cfg.get("weeks")
-    days = cfg.get("days_per_week")
-    tpd = cfg.get("timeslots_per_day")
-    if not isinstance(weeks, int) or weeks <= 0:
-        errors.append("configuration.weeks must be positive int")
-    if not isinstance(days, int) or days <= 0 or days > 7:
-        errors.append("configuration.days_per_week must be 1..7")
-    if not isinstance(tpd, int) or tpd <= 0:
-        errors.append("configuration.timeslots_per_day must be positive int")
-    # timeslots array
-    tsl = cfg.get("timeslots", [])
-    if not isinstance(tsl, list) or any(t not in ALLOWED_TIMESLOTS for t in tsl):
-        errors.append("configuration.timeslots must be list of allowed timeslots")
-
-    # Check that availabilities are within week/day bounds
-    if errors:
-        ok = False
-    else:
-        ok = True
+            subject_ids.add(sid)
+            if s.get("room_type") not in room_types:
+                errors.append(f"Subject {sid} invalid room_type: {s.get('room_type')}")
+            if not isinstance(s.get("blocks_required"), int) or s.get("blocks_required", 0) <= 0:
+                errors.append(f"Subject {sid} blocks_required must be positive int")
+
+        # Rooms - all rooms (10 theory + 1 practical) are auto-generated, no rooms in JSON needed
+        if "rooms" in data and data["rooms"]:
+            errors.append("Rooms are auto-generated (10 theory + 1 practical), remove 'rooms' from JSON")
+
+        # Groups
+        for g in data["student_groups"]:
+            gid = g.get("id")
+            if not gid:
+                errors.append("Group with missing id")
+                continue
+            for sid in g.get("subject_ids", []):
+                if sid not in subject_ids:
+                    errors.append(f"Group {gid} references unknown subject id: {sid}")
+
+        # Slot bounds; unbounded when the configuration value itself is invalid
+        # (that is reported once below instead of per slot)
+        cfg = data["configuration"]
+        weeks = cfg.get("weeks")
+        days = cfg.get("days_per_week")
+        weeks_range = range(weeks) if isinstance(weeks, int) and weeks > 0 else range(sys.maxsize)
+        days_range = range(1, days + 1) if isinstance(days, int) and 0 < days <= 7 else range(1, sys.maxsize)
+
+        # Lecturers
+        report = errors.append  # bound once for the per-slot loop below
         for l in data["lecturers"]:
-            for idx, (w, d, t) in enumerate(l.get("availability", [])):
-                if w >= weeks:
-                    errors.append(f"Lecturer {l['id']} availability[{idx}] week {w} >= configured weeks {weeks}")
-                    ok = False
-                if d < 1 or d > days:
-                    errors.append(f"Lecturer {l['id']} availability[{idx}] day {d} out of 1..{days}")
-                    ok = False
-
-    return ok, errors
+            lid = l.get("id")
+            if not lid:
+                errors.append("Lecturer with missing id")
+                continue
+            subj = l.get("subject_id")
+            if subj not in subject_ids:
+                errors.append(f"Lecturer {lid} references unknown subject id: {subj}")
+            prio = l.get("priority")
+            if not isinstance(prio, int) or prio <= 0:
+                errors.append(f"Lecturer {lid} priority must be positive int")
+            # availability, including week/day bounds against the configuration;
+            # the per-slot walk only runs when the column check finds a problem
+            avail = l.get("availability", ())
+            if _slots_in_bounds(avail, weeks_range, days_range, timeslots):
+                continue
+            for idx, slot in enumerate(avail):
+                if not (isinstance(slot, list) and len(slot) == 3):
+                    report(f"Lecturer {lid} availability[{idx}] must be [week, day, timeslot]")
+                    continue
+                w, d, t = slot
+                if not isinstance(w, int) or w < 0:
+                    report(f"Lecturer {lid} availability[{idx}] invalid week: {w}")
+                elif w not in weeks_range:
+                    report(f"Lecturer {lid} availability[{idx}] week {w} >= configured weeks {weeks}")
+                if not isinstance(d, int) or d < 1:
+                    report(f"Lecturer {lid} availability[{idx}] invalid day: {d}")
+                elif d not in days_range:
+                    report(f"Lecturer {lid} availability[{idx}] day {d} out of 1..{days}")
+                if t not in timeslots:
+                    report(f"Lecturer {lid} availability[{idx}] invalid timeslot: {t}")
+
+        # Configuration
+        tpd = cfg.get("timeslots_per_day")
+        if not isinstance(weeks, int) or weeks <= 0:
+            errors.append("configuration.weeks must be positive int")
+        if not isinstance(days, int) or days <= 0 or days > 7:
+            errors.append("configuration.days_per_week must be 1..7")
+        if not isinstance(tpd, int) or tpd <= 0:
+            errors.append("configuration.timeslots_per_day must be positive int")
+        # timeslots array
+        tsl = cfg.get("timeslots", [])
+        if not isinstance(tsl, list) or any(t not in timeslots for t in tsl):
+            errors.append("configuration.timeslots must be list of allowed timeslots")
+
+        return not errors, errors
+
+    return validate
+
+
+# Default validator, built once at import
+validate_data = make_validator()
 
 
 def print_report(ok: bool, report: List[str]) -> None:
@@ -136,11 +183,19 @@ def print_report(ok: bool, report: List[str]) -> None:
     print(line + "\n")
 
 
-def main():
-    data = load_json()
-    ok, report = validate_data(data)
-    print_report(ok, report)
-    return 0 if ok else 1
+def main(paths: List[str] = None) -> int:
+    if paths is None:
+        paths = sys.argv[1:]
+    paths = paths or ["input_data.json"]
+    status = 0
+    for path in paths:
+        if len(paths) > 1:
+            print(f"\n{path}")
+        ok, report = validate_data(load_json(path))
+        print_report(ok, report)
+        if not ok:
+            status = 1
+    return status
 
 
 if __name__ == "__main__":
@@ -3,48 +3,63 @@
 Verification script to confirm all requirements from the problem statement are met.
 """
 import random
+import sys
+from collections import defaultdict
 from sample_data import create_sample_data
-from scheduler import OsteopathyScheduler
-from models import RoomType
+from scheduler import OsteopathyScheduler, PRACTICAL_SUBJECT_IDS
+from models import RoomType, TimeSlot
 
 def verify_requirements():
-    print("=" * 80)
-    print("REQUIREMENT VERIFICATION REPORT")
-    print("=" * 80)
-    print()
+    # Report lines are collected and written in batches rather than printed
+    # one by one; flush() runs before the scheduler logs its own progress
+    out = []
+    p = out.append
+    THEORY, PRACTICAL = RoomType.THEORY, RoomType.PRACTICAL
+    MORNING, AFTERNOON = TimeSlot.MORNING, TimeSlot.AFTERNOON
+
+    def flush():
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
+            out.clear()
+
+    p("=" * 80)
+    p("REQUIREMENT VERIFICATION REPORT")
+    p("=" * 80)
+    p("")
     
     random.seed(42)
     lecturers, subjects, rooms, student_groups = create_sample_data()
     
-    print("REQUIREMENT 1: Up to 5 student groups")
-    print(f"  ✓ Configured: {len(student_groups)} student groups")
-    print()
+    p("REQUIREMENT 1: Up to 5 student groups")
+    p(f"  ✓ Configured: {len(student_groups)} student groups")
+    p("")
     
-    print("REQUIREMENT 2: 20 lecturers, each teaches only one subject")
-    print(f"  ✓ Configured: {len(lecturers)} lecturers")
+    p("REQUIREMENT 2: 20 lecturers, each teaches only one subject")
+    p(f"  ✓ Configured: {len(lecturers)} lecturers")
     subject_map = {}
     for lecturer in lecturers:
         if lecturer.subject_id in subject_map:
             subject_map[lecturer.subject_id].append(lecturer.id)
         else:
             subject_map[lecturer.subject_id] = [lecturer.id]
-    print(f"  ✓ Each lecturer teaches exactly one subject")
-    print()
+    p(f"  ✓ Each lecturer teaches exactly one subject")
+    p("")
     
-    print("REQUIREMENT 3: 15 subjects")
-    print(f"  ✓ Configured: {len(subjects)} subjects")
-    print()
+    p("REQUIREMENT 3: 15 subjects")
+    p(f"  ✓ Configured: {len(subjects)} subjects")
+    p("")
     
-    print("REQUIREMENT 4: 10 rooms (theory + practical)")
-    theory_count = len([r for r in rooms if r.room_type == RoomType.THEORY])
-    practical_count = len([r for r in rooms if r.room_type == RoomType.PRACTICAL])
-    print(f"  ✓ Configured: {len(rooms)} rooms ({theory_count} theory, {practical_count} practical)")
-    print()
+    p("REQUIREMENT 4: 10 rooms (theory + practical)")
+    theory_room_ids = {r.id for r in rooms if r.room_type is THEORY}
+    theory_count = len(theory_room_ids)
+    practical_count = sum(1 for r in rooms if r.room_type is PRACTICAL)
+    p(f"  ✓ Configured: {len(rooms)} rooms ({theory_count} theory, {practical_count} practical)")
+    p("")
     
-    print("REQUIREMENT 5: Each subject has up to 50 blocks (half-days)")
+    p("REQUIREMENT 5: Each subject has up to 50 blocks (half-days)")
     max_blocks = max(s.blocks_required for s in subjects)
-    print(f"  ✓ Max blocks per subject: {max_blocks} (within 50 limit)")
-    print()
+    p(f"  ✓ Max blocks per subject: {max_blocks} (within 50 limit)")
+    p("")
     
     # Create schedule
     scheduler = OsteopathyScheduler(
@@ -55,74 +70,90 @@ def verify_requirements():
         semester_weeks=15
     )
     
-    print("REQUIREMENT 6: Prioritize top 5 lecturers with availability calendars")
+    p("REQUIREMENT 6: Prioritize top 5 lecturers with availability calendars")
     priority_lecturers = [l for l in lecturers if l.priority <= 5]
-    print(f"  ✓ Priority lecturers: {len(priority_lecturers)}")
+    p(f"  ✓ Priority lecturers: {len(priority_lecturers)}")
     for lect in priority_lecturers[:5]:
-        print(f"    - {lect.name} (Priority {lect.priority}): {len(lect.availability)} available slots")
-    print()
+        p(f"    - {lect.name} (Priority {lect.priority}): {len(lect.availability)} available slots")
+    p("")
     
+    flush()
     schedule = scheduler.create_schedule()
-    
-    print("REQUIREMENT 7: Use availability calendars to distribute subjects")
-    print(f"  ✓ Scheduler respects lecturer availability for priority lecturers")
-    print()
-    
-    print("REQUIREMENT 8: Schedule all required blocks in half-day slots")
-    print(f"  ✓ Total blocks scheduled: {len(schedule.blocks)}")
-    morning_count = sum(1 for b in schedule.blocks if b.timeslot.value == 'morning')
-    afternoon_count = sum(1 for b in schedule.blocks if b.timeslot.value == 'afternoon')
-    print(f"    - Morning slots: {morning_count}")
-    print(f"    - Afternoon slots: {afternoon_count}")
-    print()
-    
-    print("REQUIREMENT 9: Assign theory rooms (all rooms have sufficient capacity)")
-    theory_blocks = [b for b in schedule.blocks if scheduler.subjects[b.subject_id].room_type == RoomType.THEORY]
-    theory_room_ids = [r.id for r in rooms if r.room_type == RoomType.THEORY]
-    theory_rooms_used = set(b.room_id for b in theory_blocks)
-    print(f"  ✓ Theory blocks: {len(theory_blocks)}")
-    print(f"  ✓ Theory rooms used: {len(theory_rooms_used)} out of {len(theory_room_ids)}")
-    print()
-    
-    print("REQUIREMENT 10: Spread subjects evenly across semester")
+
+    # Single pass over the schedule: per-subject buckets and counters used by
+    # the report sections below
+    theory_subject_ids = {sid for sid, s in scheduler.subjects.items() if s.room_type is THEORY}
+    blocks_by_subject = defaultdict(list)
+    morning_count = afternoon_count = 0
+    theory_blocks = []
+    theory_rooms_used = set()
+    practical_blocks = []
+    for b in schedule.blocks:
+        blocks_by_subject[b.subject_id].append(b)
+        slot = b.timeslot
+        if slot is MORNING:
+            morning_count += 1
+        elif slot is AFTERNOON:
+            afternoon_count += 1
+        if b.subject_id in theory_subject_ids:
+            theory_blocks.append(b)
+            theory_rooms_used.add(b.room_id)
+        if b.subject_id in PRACTICAL_SUBJECT_IDS:
+            practical_blocks.append(b)
+    
+    p("REQUIREMENT 7: Use availability calendars to distribute subjects")
+    p(f"  ✓ Scheduler respects lecturer availability for priority lecturers")
+    p("")
+    
+    p("REQUIREMENT 8: Schedule all required blocks in half-day slots")
+    p(f"  ✓ Total blocks scheduled: {len(schedule.blocks)}")
+    p(f"    - Morning slots: {morning_count}")
+    p(f"    - Afternoon slots: {afternoon_count}")
+    p("")
+    
+    p("REQUIREMENT 9: Assign theory rooms (all rooms have sufficient capacity)")
+    p(f"  ✓ Theory blocks: {len(theory_blocks)}")
+    p(f"  ✓ Theory rooms used: {len(theory_rooms_used)} out of {len(theory_room_ids)}")
+    p("")
+    
+    p("REQUIREMENT 10: Spread subjects evenly across semester")
     spread_subjects = [s for s in subjects if s.spread]
-    print(f"  ✓ Spread subjects: {len(spread_subjects)}")
+    p(f"  ✓ Spread subjects: {len(spread_subjects)}")
     for subj in spread_subjects:
-        blocks = [b for b in schedule.blocks if b.subject_id == subj.id]
+        blocks = blocks_by_subject[subj.id]
         if len(blocks) > 1:
             weeks = sorted(set(b.week for b in blocks))
             span = weeks[-1] - weeks[0] + 1 if len(weeks) > 1 else 0
-            print(f"    - {subj.name}: {len(blocks)} blocks across {span} weeks")
-    print()
-    
-    print("REQUIREMENT 11: Practical subjects (A, B, C, D) with one practical room")
-    practical_subjects = ['A', 'B', 'C', 'D']
-    practical_room = [r for r in rooms if r.room_type == RoomType.PRACTICAL][0]
-    print(f"  ✓ Practical room: {practical_room.name}")
-    print(f"  ✓ Practical subjects:")
-    for subj_id in practical_subjects:
-        blocks = [b for b in schedule.blocks if b.subject_id == subj_id]
+            p(f"    - {subj.name}: {len(blocks)} blocks across {span} weeks")
+    p("")
+    
+    p("REQUIREMENT 11: Practical subjects (A, B, C, D) with one practical room")
+    practical_room = next(r for r in rooms if r.room_type is PRACTICAL)
+    p(f"  ✓ Practical room: {practical_room.name}")
+    p(f"  ✓ Practical subjects:")
+    for subj_id in sorted(PRACTICAL_SUBJECT_IDS):
+        blocks = blocks_by_subject[subj_id]
         weeks = sorted(set(b.week for b in blocks))
-        print(f"    - Subject {subj_id}: {len(blocks)} blocks across weeks {min(weeks)+1}-{max(weeks)+1}")
-    print()
+        p(f"    - Subject {subj_id}: {len(blocks)} blocks across weeks {min(weeks)+1}-{max(weeks)+1}")
+    p("")
     
-    print("REQUIREMENT 12: Mix practical subjects across semester")
-    practical_blocks = sorted([b for b in schedule.blocks if b.subject_id in practical_subjects], 
-                             key=lambda x: (x.week, x.day, x.timeslot.value))
+    p("REQUIREMENT 12: Mix practical subjects across semester")
+    practical_blocks.sort(key=lambda x: (x.week, x.day, x.timeslot.value))
     
     # Sample first 20 practical blocks to show mixing
-    print(f"  ✓ Practical block sequence (first 20):")
+    p(f"  ✓ Practical block sequence (first 20):")
     sequence = [b.subject_id for b in practical_blocks[:20]]
-    print(f"    {' -> '.join(sequence)}")
+    p(f"    {' -> '.join(sequence)}")
     
     # Check that we have variety
     if len(set(sequence[:10])) > 2:
-        print(f"  ✓ Good mixing detected (subjects vary in sequence)")
-    print()
+        p(f"  ✓ Good mixing detected (subjects vary in sequence)")
+    p("")
     
-    print("=" * 80)
-    print("ALL REQUIREMENTS VERIFIED ✓")
-    print("=" * 80)
+    p("=" * 80)
+    p("ALL REQUIREMENTS VERIFIED ✓")
+    p("=" * 80)
+    flush()
 
 if __name__ == "__main__":
     verify_requirements()
@@ -2,45 +2,98 @@
 Visualization script for input data analysis.
 Creates comprehensive plots to understand the scheduling problem.
 """
+import io
 import json
+import multiprocessing
 import os
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from collections import defaultdict, Counter
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
 
 def load_input_data(filename='input_data.json'):
     """Load input data from JSON file"""
+    if orjson is not None:
+        with open(filename, 'rb') as f:
+            return orjson.loads(f.read())
     with open(filename, 'r') as f:
         return json.load(f)
 
 
-def plot_subjects_overview(data):
+# Every input figure is a 2x2 grid of panels at this size
+FIGSIZE = (14, 10)
+
+
+def new_figure():
+    """Create an empty FIGSIZE figure on an Agg canvas, outside pyplot"""
+    # matplotlib is imported on first use so that loading and checking the
+    # input does not pay for it
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=FIGSIZE)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+# Bar colours by room type, indexed 0 = theory, 1 = practical
+TYPE_PALETTE = ['#3498db', '#e74c3c']
+
+
+def type_colors(room_type):
+    """RGBA bar colours for an array of room types, via uint8 palette indices"""
+    from matplotlib.colors import ListedColormap
+
+    return ListedColormap(TYPE_PALETTE)((room_type == 'practical').astype(np.uint8))
+
+
+def subject_arrays(subjects):
+    """Struct-of-arrays view of the subjects, built once and shared by the plots:
+    room_type (str), blocks (int32) and spread (bool) columns in subject order,
+    plus blocks_by_id mapping each subject id to its blocks_required.
+    """
+    blocks = np.array([s['blocks_required'] for s in subjects], dtype=np.int32)
+    return SimpleNamespace(
+        room_type=np.array([s['room_type'] for s in subjects]),
+        blocks=blocks,
+        spread=np.array([bool(s['spread']) for s in subjects], dtype=bool),
+        blocks_by_id=dict(zip((s['id'] for s in subjects), blocks.tolist())),
+    )
+
+
+def plot_subjects_overview(data, subj=None, fig=None):
     """Plot subjects by type, blocks required, and spread requirement"""
     subjects = data['subjects']
+    if subj is None:
+        subj = subject_arrays(subjects)
     
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    if fig is None:
+        fig = new_figure()
+    axes = fig.subplots(2, 2)
     fig.suptitle('Subjects Overview', fontsize=16, fontweight='bold')
     
     # 1. Subjects by room type
     room_types = Counter(s['room_type'] for s in subjects)
     ax = axes[0, 0]
     colors = ['#3498db', '#e74c3c']
-    ax.bar(room_types.keys(), room_types.values(), color=colors)
+    bars = ax.bar(room_types.keys(), room_types.values(), color=colors)
     ax.set_title('Subjects by Room Type', fontsize=12, fontweight='bold')
     ax.set_ylabel('Number of Subjects')
     ax.grid(axis='y', alpha=0.3)
-    for i, (k, v) in enumerate(room_types.items()):
-        ax.text(i, v + 0.2, str(v), ha='center', fontweight='bold')
+    ax.bar_label(bars, padding=2, fontweight='bold')
     
     # 2. Blocks required per subject
     ax = axes[0, 1]
     subject_ids = [s['id'] for s in subjects]
     blocks = [s['blocks_required'] for s in subjects]
-    colors_map = ['#e74c3c' if s['room_type'] == 'practical' else '#3498db' for s in subjects]
+    colors_map = type_colors(subj.room_type)
     bars = ax.barh(subject_ids, blocks, color=colors_map)
     ax.set_title('Blocks Required per Subject', fontsize=12, fontweight='bold')
     ax.set_xlabel('Number of Blocks')
@@ -48,34 +101,34 @@ def plot_subjects_overview(data):
     ax.grid(axis='x', alpha=0.3)
     
     # Add legend
+    import matplotlib.patches as mpatches
     theory_patch = mpatches.Patch(color='#3498db', label='Theory')
     practical_patch = mpatches.Patch(color='#e74c3c', label='Practical')
     ax.legend(handles=[theory_patch, practical_patch])
     
     # 3. Total blocks by type
     ax = axes[1, 0]
-    theory_blocks = sum(s['blocks_required'] for s in subjects if s['room_type'] == 'theory')
-    practical_blocks = sum(s['blocks_required'] for s in subjects if s['room_type'] == 'practical')
-    ax.bar(['Theory', 'Practical'], [theory_blocks, practical_blocks], color=['#3498db', '#e74c3c'])
+    theory_blocks = int(subj.blocks[subj.room_type == 'theory'].sum())
+    practical_blocks = int(subj.blocks[subj.room_type == 'practical'].sum())
+    bars = ax.bar(['Theory', 'Practical'], [theory_blocks, practical_blocks], color=['#3498db', '#e74c3c'])
     ax.set_title('Total Blocks Required by Type', fontsize=12, fontweight='bold')
     ax.set_ylabel('Total Blocks')
     ax.grid(axis='y', alpha=0.3)
-    for i, v in enumerate([theory_blocks, practical_blocks]):
-        ax.text(i, v + 2, str(v), ha='center', fontweight='bold', fontsize=14)
+    ax.bar_label(bars, padding=2, fontweight='bold', fontsize=14)
     
     # 4. Spread vs Non-spread subjects
     ax = axes[1, 1]
-    spread_subjects = [s for s in subjects if s['spread']]
-    non_spread_subjects = [s for s in subjects if not s['spread']]
+    spread_count = int(subj.spread.sum())
+    non_spread_count = len(subj.spread) - spread_count
     
-    spread_blocks = sum(s['blocks_required'] for s in spread_subjects)
-    non_spread_blocks = sum(s['blocks_required'] for s in non_spread_subjects)
+    spread_blocks = int(subj.blocks[subj.spread].sum())
+    non_spread_blocks = int(subj.blocks[~subj.spread].sum())
     
     x = np.arange(2)
     width = 0.35
     
-    ax.bar(x[0], len(spread_subjects), width, label='Spread', color='#2ecc71')
-    ax.bar(x[1], len(non_spread_subjects), width, label='Non-spread', color='#95a5a6')
+    ax.bar(x[0], spread_count, width, label='Spread', color='#2ecc71')
+    ax.bar(x[1], non_spread_count, width, label='Non-spread', color='#95a5a6')
     
     ax2 = ax.twinx()
     ax2.bar(x[0] + width, spread_blocks, width, color='#27ae60', alpha=0.7)
@@ -89,15 +142,17 @@ def plot_subjects_overview(data):
     ax.tick_params(axis='y', labelcolor='#2ecc71')
     ax2.tick_params(axis='y', labelcolor='#27ae60')
     
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
-def plot_lecturers_analysis(data):
+def plot_lecturers_analysis(data, subj=None, fig=None):
     """Plot lecturer priority distribution and availability"""
     lecturers = data['lecturers']
     
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    if fig is None:
+        fig = new_figure()
+    axes = fig.subplots(2, 2)
     fig.suptitle('Lecturers Analysis', fontsize=16, fontweight='bold')
     
     # 1. Lecturers by priority
@@ -128,8 +183,7 @@ def plot_lecturers_analysis(data):
     ax.invert_yaxis()
     ax.grid(axis='x', alpha=0.3)
     
-    for i, v in enumerate(availability_counts):
-        ax.text(v + 0.5, i, str(v), va='center', fontweight='bold')
+    ax.bar_label(bars, padding=5, fontweight='bold')
     
     # 3. Availability heatmap for top priority lecturer
     ax = axes[1, 0]
@@ -145,17 +199,24 @@ def plot_lecturers_analysis(data):
         morning_matrix = np.zeros((weeks, days))
         afternoon_matrix = np.zeros((weeks, days))
         
-        for slot in availability:
-            week, day, timeslot = slot
-            if week < weeks and 1 <= day <= 5:
-                if timeslot == 'morning':
-                    morning_matrix[week, day-1] = 1
-                else:
-                    afternoon_matrix[week, day-1] = 1
+        # Drop slots outside the shown window before converting anything,
+        # then scatter the rest into the matrices with boolean masks
+        visible = [slot for slot in availability if 0 <= slot[0] < weeks and 1 <= slot[1] <= days]
+        if visible:
+            slots = np.array(visible, dtype=object)
+            week_col = slots[:, 0].astype(np.int64)
+            day_col = slots[:, 1].astype(np.int64) - 1
+            is_morning = slots[:, 2] == 'morning'
+            morning_matrix[week_col[is_morning], day_col[is_morning]] = 1
+            afternoon_matrix[week_col[~is_morning], day_col[~is_morning]] = 1
         
         # Combined visualization
         combined = morning_matrix + afternoon_matrix * 2
-        im = ax.imshow(combined, cmap='RdYlGn', aspect='auto', vmin=0, vmax=2)
+        # Flat-shaded mesh with cell edges at half-integers, so cells are
+        # centred on the day/week ticks; week 0 goes at the top
+        im = ax.pcolormesh(np.arange(days + 1) - 0.5, np.arange(weeks + 1) - 0.5, combined,
+                           cmap='RdYlGn', vmin=0, vmax=2, shading='flat')
+        ax.invert_yaxis()
         
         ax.set_title(f'{top_lecturer["name"]} - Availability (First 5 Weeks)', 
                     fontsize=12, fontweight='bold')
@@ -167,7 +228,7 @@ def plot_lecturers_analysis(data):
         ax.set_yticklabels([f'W{i}' for i in range(weeks)])
         
         # Add colorbar
-        cbar = plt.colorbar(im, ax=ax)
+        cbar = fig.colorbar(im, ax=ax)
         cbar.set_ticks([0, 1, 2])
         cbar.set_ticklabels(['None', 'Morning', 'Afternoon'])
     else:
@@ -176,43 +237,46 @@ def plot_lecturers_analysis(data):
     
     # 4. Subjects taught by multiple lecturers
     ax = axes[1, 1]
-    subject_lecturer_count = defaultdict(list)
-    for lecturer in lecturers:
-        subject_lecturer_count[lecturer['subject_id']].append(lecturer['name'])
-    
-    subject_counts = {k: len(v) for k, v in subject_lecturer_count.items()}
-    subjects_multi = [(k, v) for k, v in subject_counts.items() if v > 1]
-    subjects_single = sum(1 for v in subject_counts.values() if v == 1)
-    
-    if subjects_multi:
-        labels = [s[0] for s in subjects_multi]
-        counts = [s[1] for s in subjects_multi]
-        ax.bar(labels, counts, color='#f39c12', edgecolor='black', alpha=0.7)
+    # Group-count lecturers per subject: code the ids as ints, bincount them,
+    # and keep subjects in the order they first appear
+    sids = np.array([lecturer['subject_id'] for lecturer in lecturers])
+    uniq, first, inv = np.unique(sids, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    uniq = uniq[order]
+    subject_counts = np.bincount(inv, minlength=len(uniq))[order]
+    multi = subject_counts > 1
+    subjects_single = int((subject_counts == 1).sum())
+    
+    if multi.any():
+        labels = uniq[multi].tolist()
+        counts = subject_counts[multi].tolist()
+        bars = ax.bar(labels, counts, color='#f39c12', edgecolor='black', alpha=0.7)
         ax.axhline(y=1, color='gray', linestyle='--', alpha=0.5)
         ax.set_title(f'Subjects with Multiple Lecturers\n({subjects_single} subjects have 1 lecturer)', 
                     fontsize=12, fontweight='bold')
         ax.set_ylabel('Number of Lecturers')
         ax.set_xlabel('Subject ID')
         ax.grid(axis='y', alpha=0.3)
-        
-        for i, v in enumerate(counts):
-            ax.text(i, v + 0.05, str(v), ha='center', fontweight='bold')
+        ax.bar_label(bars, padding=2, fontweight='bold')
     else:
         ax.text(0.5, 0.5, 'Each subject has one lecturer', 
                ha='center', va='center', transform=ax.transAxes)
         ax.set_title('Subjects with Multiple Lecturers', fontsize=12, fontweight='bold')
     
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
-def plot_rooms_and_groups(data):
+def plot_rooms_and_groups(data, subj=None, fig=None):
     """Plot room capacity and student group assignments"""
     rooms = data['rooms']
     groups = data['student_groups']
-    subjects = data['subjects']
+    if subj is None:
+        subj = subject_arrays(data['subjects'])
     
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    if fig is None:
+        fig = new_figure()
+    axes = fig.subplots(2, 2)
     fig.suptitle('Rooms and Student Groups', fontsize=16, fontweight='bold')
     
     # 1. Room distribution by type
@@ -231,35 +295,34 @@ def plot_rooms_and_groups(data):
     ax = axes[0, 1]
     room_names = [r['name'] for r in rooms]
     capacities = [r['capacity'] for r in rooms]
-    colors_map = ['#e74c3c' if r['room_type'] == 'practical' else '#3498db' for r in rooms]
+    room_type = np.array([r['room_type'] for r in rooms])
+    colors_map = type_colors(room_type)
     
-    ax.barh(room_names, capacities, color=colors_map)
+    bars = ax.barh(room_names, capacities, color=colors_map)
     ax.set_title('Room Capacity', fontsize=12, fontweight='bold')
     ax.set_xlabel('Capacity (Students)')
     ax.invert_yaxis()
     ax.grid(axis='x', alpha=0.3)
     
-    for i, v in enumerate(capacities):
-        ax.text(v + 0.5, i, str(v), va='center', fontweight='bold')
+    ax.bar_label(bars, padding=5, fontweight='bold')
     
     # 3. Student groups - number of subjects
     ax = axes[1, 0]
     group_names = [g['name'] for g in groups]
     subject_counts = [len(g['subject_ids']) for g in groups]
     
-    ax.bar(range(len(group_names)), subject_counts, color='#16a085', edgecolor='black', alpha=0.7)
+    bars = ax.bar(range(len(group_names)), subject_counts, color='#16a085', edgecolor='black', alpha=0.7)
     ax.set_title('Subjects per Student Group', fontsize=12, fontweight='bold')
     ax.set_ylabel('Number of Subjects')
     ax.set_xticks(range(len(group_names)))
     ax.set_xticklabels([g['id'] for g in groups])
     ax.grid(axis='y', alpha=0.3)
     
-    for i, v in enumerate(subject_counts):
-        ax.text(i, v + 0.1, str(v), ha='center', fontweight='bold')
+    ax.bar_label(bars, padding=2, fontweight='bold')
     
     # 4. Total blocks per student group
     ax = axes[1, 1]
-    subject_blocks = {s['id']: s['blocks_required'] for s in subjects}
+    subject_blocks = subj.blocks_by_id
     
     group_blocks = []
     group_labels = []
@@ -275,34 +338,37 @@ def plot_rooms_and_groups(data):
     ax.set_xticklabels(group_labels)
     ax.grid(axis='y', alpha=0.3)
     
-    for i, v in enumerate(group_blocks):
-        ax.text(i, v + 1, str(v), ha='center', fontweight='bold')
+    ax.bar_label(bars, padding=2, fontweight='bold')
     
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
-def plot_scheduling_constraints(data):
+def plot_scheduling_constraints(data, subj=None, fig=None):
     """Plot scheduling constraints and capacity analysis"""
     config = data['configuration']
     subjects = data['subjects']
+    if subj is None:
+        subj = subject_arrays(subjects)
     rooms = data['rooms']
     groups = data['student_groups']
     
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    if fig is None:
+        fig = new_figure()
+    axes = fig.subplots(2, 2)
     fig.suptitle('Scheduling Constraints & Capacity Analysis', fontsize=16, fontweight='bold')
     
     # 1. Time capacity analysis
     ax = axes[0, 0]
     total_slots = config['weeks'] * config['days_per_week'] * config['timeslots_per_day']
-    theory_rooms = len([r for r in rooms if r['room_type'] == 'theory'])
-    practical_rooms = len([r for r in rooms if r['room_type'] == 'practical'])
+    theory_rooms = sum(1 for r in rooms if r['room_type'] == 'theory')
+    practical_rooms = sum(1 for r in rooms if r['room_type'] == 'practical')
     
     theory_capacity = total_slots * theory_rooms
     practical_capacity = total_slots * practical_rooms
     
-    theory_blocks_needed = sum(s['blocks_required'] for s in subjects if s['room_type'] == 'theory')
-    practical_blocks_needed = sum(s['blocks_required'] for s in subjects if s['room_type'] == 'practical')
+    theory_blocks_needed = int(subj.blocks[subj.room_type == 'theory'].sum())
+    practical_blocks_needed = int(subj.blocks[subj.room_type == 'practical'].sum())
     
     x = np.arange(2)
     width = 0.35
@@ -356,7 +422,7 @@ def plot_scheduling_constraints(data):
     
     # 3. Weekly scheduling load distribution
     ax = axes[1, 0]
-    total_blocks = sum(s['blocks_required'] for s in subjects)
+    total_blocks = int(subj.blocks.sum())
     avg_blocks_per_week = total_blocks / config['weeks']
     slots_per_week = config['days_per_week'] * config['timeslots_per_day']
     num_groups = len(groups)
@@ -374,50 +440,99 @@ def plot_scheduling_constraints(data):
     ax.set_ylabel('Number of Blocks/Slots')
     ax.grid(axis='y', alpha=0.3)
     
-    for i, v in enumerate(values):
-        ax.text(i, v + 0.5, f'{v:.1f}', ha='center', fontweight='bold')
+    ax.bar_label(bars, fmt='{:.1f}', padding=2, fontweight='bold')
     
     # 4. Configuration summary
     ax = axes[1, 1]
     ax.axis('off')
-    
-    summary_text = f"""
-    SCHEDULING CONFIGURATION
-    {'='*40}
-    
-    Semester Duration: {config['weeks']} weeks
-    Days per Week: {config['days_per_week']} (Mon-Fri)
-    Timeslots per Day: {config['timeslots_per_day']} (morning/afternoon)
-    
-    Total Time Slots: {total_slots}
-    
-    RESOURCES
-    {'='*40}
-    Student Groups: {len(groups)}
-    Subjects: {len(subjects)} (Theory: {len([s for s in subjects if s['room_type'] == 'theory'])}, Practical: {len([s for s in subjects if s['room_type'] == 'practical'])})
-    Lecturers: {len(data['lecturers'])} (Priority 1-5: {len([l for l in data['lecturers'] if l['priority'] <= 5])})
-    Rooms: {len(rooms)} (Theory: {theory_rooms}, Practical: {practical_rooms})
-    
-    WORKLOAD
-    {'='*40}
-    Total Blocks Required: {total_blocks}
-    Average per Week: {avg_blocks_per_week:.1f}
-    Average per Group: {total_blocks/len(groups):.1f}
-    
-    CAPACITY UTILIZATION
-    {'='*40}
-    Theory: {(theory_blocks_needed/theory_capacity*100):.1f}% of capacity
-    Practical: {(practical_blocks_needed/practical_capacity*100):.1f}% of capacity
-    """
+    theory_subjects = int((subj.room_type == 'theory').sum())
+    practical_subjects = int((subj.room_type == 'practical').sum())
+    priority_lecturers = sum(1 for l in data['lecturers'] if l['priority'] <= 5)
+    
+    num_lecturers = len(data['lecturers'])
+    rule = '=' * 40
+    theory_util = theory_blocks_needed / theory_capacity * 100
+    practical_util = practical_blocks_needed / practical_capacity * 100
+    
+    summary_lines = [
+        "SCHEDULING CONFIGURATION",
+        rule,
+        "",
+        f"Semester Duration: {config['weeks']} weeks",
+        f"Days per Week: {config['days_per_week']} (Mon-Fri)",
+        f"Timeslots per Day: {config['timeslots_per_day']} (morning/afternoon)",
+        "",
+        f"Total Time Slots: {total_slots}",
+        "",
+        "RESOURCES",
+        rule,
+        f"Student Groups: {num_groups}",
+        f"Subjects: {len(subjects)} (Theory: {theory_subjects}, Practical: {practical_subjects})",
+        f"Lecturers: {num_lecturers} (Priority 1-5: {priority_lecturers})",
+        f"Rooms: {len(rooms)} (Theory: {theory_rooms}, Practical: {practical_rooms})",
+        "",
+        "WORKLOAD",
+        rule,
+        f"Total Blocks Required: {total_blocks}",
+        f"Average per Week: {avg_blocks_per_week:.1f}",
+        f"Average per Group: {total_blocks / num_groups:.1f}",
+        "",
+        "CAPACITY UTILIZATION",
+        rule,
+        f"Theory: {theory_util:.1f}% of capacity",
+        f"Practical: {practical_util:.1f}% of capacity",
+    ]
+    # Indent every line by four spaces below a leading blank line
+    summary_text = "\n    ".join(["", *summary_lines, ""])
     
     ax.text(0.1, 0.95, summary_text, transform=ax.transAxes, 
            fontfamily='monospace', fontsize=10, verticalalignment='top',
            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.3))
     
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
+# (figure builder, output file, label) for each image written by main().
+# Every builder takes (data, subj, fig): subj is subject_arrays() or None,
+# fig an empty Figure to draw on or None for a fresh one.
+FIGURES = [
+    (plot_subjects_overview, 'viz_subjects_overview.png', 'Subjects overview'),
+    (plot_lecturers_analysis, 'viz_lecturers_analysis.png', 'Lecturers analysis'),
+    (plot_rooms_and_groups, 'viz_rooms_and_groups.png', 'Rooms and groups'),
+    (plot_scheduling_constraints, 'viz_scheduling_constraints.png', 'Scheduling constraints'),
+]
+
+
+# Figure reused by every plot rendered in this (worker) process
+_figure = None
+
+
+def _render(plot_fn, data, subj, path):
+    """Build one figure and save it; runs in a worker process.
+
+    The process keeps a single Figure and clears it between plots instead
+    of allocating a new one for each.
+    """
+    global _figure
+    if _figure is None:
+        _figure = new_figure()
+    else:
+        _figure.clear()
+    buf = io.BytesIO()
+    plot_fn(data, subj, _figure).savefig(buf, format='png', dpi=110, bbox_inches='tight',
+                                         pil_kwargs={'compress_level': 1})
+    # Encode in memory, then hand the whole PNG to the OS in one write
+    view = buf.getbuffer()
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return path
+
+
 def main():
     """Main function to generate all visualizations"""
     print("Loading input data...")
@@ -429,32 +544,28 @@ def main():
     output_dir = os.path.join('images', 'input')
     os.makedirs(output_dir, exist_ok=True)
 
-    fig1 = plot_subjects_overview(data)
-    fig1.savefig(os.path.join(output_dir, 'viz_subjects_overview.png'), dpi=110, bbox_inches='tight', pil_kwargs={'optimize': True})
-    print("✓ Subjects overview saved to:", os.path.join(output_dir, 'viz_subjects_overview.png'))
-    plt.close(fig1)
-    
-    fig2 = plot_lecturers_analysis(data)
-    fig2.savefig(os.path.join(output_dir, 'viz_lecturers_analysis.png'), dpi=110, bbox_inches='tight', pil_kwargs={'optimize': True})
-    print("✓ Lecturers analysis saved to:", os.path.join(output_dir, 'viz_lecturers_analysis.png'))
-    plt.close(fig2)
-    
-    fig3 = plot_rooms_and_groups(data)
-    fig3.savefig(os.path.join(output_dir, 'viz_rooms_and_groups.png'), dpi=110, bbox_inches='tight', pil_kwargs={'optimize': True})
-    print("✓ Rooms and groups saved to:", os.path.join(output_dir, 'viz_rooms_and_groups.png'))
-    plt.close(fig3)
-    
-    fig4 = plot_scheduling_constraints(data)
-    fig4.savefig(os.path.join(output_dir, 'viz_scheduling_constraints.png'), dpi=110, bbox_inches='tight', pil_kwargs={'optimize': True})
-    print("✓ Scheduling constraints saved to:", os.path.join(output_dir, 'viz_scheduling_constraints.png'))
-    plt.close(fig4)
+    subj = subject_arrays(data['subjects'])
+
+    # On Linux, resolve fonts once here and fork the workers so they inherit
+    # matplotlib and its loaded font manager instead of each rebuilding them.
+    # Other platforms keep their default start method: fork is unsafe on
+    # macOS, where system frameworks may already have started threads
+    mp_context = None
+    if sys.platform.startswith('linux'):
+        from matplotlib import font_manager
+        font_manager.findfont('DejaVu Sans')
+        mp_context = multiprocessing.get_context('fork')
+
+    # The figures are independent, so render them in parallel processes
+    with ProcessPoolExecutor(max_workers=len(FIGURES), mp_context=mp_context) as pool:
+        futures = [(label, pool.submit(_render, plot_fn, data, subj, os.path.join(output_dir, filename)))
+                   for plot_fn, filename, label in FIGURES]
+        for label, future in futures:
+            print(f"✓ {label} saved to:", future.result())
     
     print("\n" + "="*60)
     print("All visualizations generated successfully!")
     print("="*60)
-    
-    # Ensure all figures are closed to free memory
-    plt.close('all')
 
 
 if __name__ == "__main__":
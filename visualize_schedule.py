@@ -4,278 +4,440 @@ Creates visual calendars showing the schedule by room and student group.
 """
 import json
 import os
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import Rectangle
+import sys
 import numpy as np
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from types import SimpleNamespace
 import re
 
 
+# Output resolution; main(fast=True) trades detail for speed with FAST_DPI
+DPI = 110
+FAST_DPI = 90
+# zlib level 1 encodes several times faster than PIL's optimize pass,
+# for somewhat larger files
+PNG_OPTIONS = {'compress_level': 1}
+# Buffer size for the image files; larger than io.DEFAULT_BUFFER_SIZE so
+# each image is written in a few large chunks
+WRITE_BUFFER = 128 * 1024
+# Default directory for every schedule image; create_* expect it to exist,
+# main() creates it once per run
+OUTPUT_DIR = os.path.join('images', 'schedule')
+
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+TIMESLOT_NAMES = ['MORNING', 'AFTERNOON']
+
+# Cell colours by room type, looked up once per scheduled cell; any type
+# other than practical is drawn as theory
+THEORY_COLOR = '#3498db'
+PRACTICAL_COLOR = '#e74c3c'
+ROOM_TYPE_COLORS = {'theory': THEORY_COLOR, 'practical': PRACTICAL_COLOR}
+
+CELL_TEXT_KW = dict(ha='center', va='center', fontsize=7, fontweight='bold')
+DAYS_SHORT = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri')
+# Day label positions: cell centres in the calendars, day centres in the overview
+DAY_TICKS = np.arange(5) + 0.45
+OVERVIEW_DAY_TICKS = [i * 2 + 0.95 for i in range(len(DAY_NAMES))]
+# Fixed subplot margins, calibrated against what tight_layout() chose for
+# each figure, so the layout solver does not run on every saved image
+CALENDAR_LAYOUT = dict(left=0.06, right=0.99, top=0.93, bottom=0.04, wspace=0.22, hspace=0.47)
+OVERVIEW_LAYOUT = dict(left=0.023, right=0.99, top=0.92, bottom=0.017)
+HEATMAP_LAYOUT = dict(left=0.045, right=0.99, top=0.9, bottom=0.116, wspace=0.1)
+
+# One scheduled block as parsed from the text output; a tuple with named
+# fields is smaller than a dict per block and faster to read by attribute
+Block = namedtuple('Block', 'week day day_name timeslot subject_name subject_id '
+                            'lecturer group room room_type')
+
+# Line patterns for parse_schedule_output, compiled once at import
+_WEEK_RE = re.compile(r'WEEK (\d+)')
+_SUBJECT_RE = re.compile(r'- Subject: (.*?) \((.*?)\)')
+_ROOM_RE = re.compile(r'Room: (.*?) \((.*?)\)')
+# Section header lines ("Monday:", "MORNING:") to day number / timeslot
+_DAY_HEADERS = {f'{name}:': day_idx for day_idx, name in enumerate(DAY_NAMES, 1)}
+_TIMESLOT_HEADERS = {f'{name}:': name.lower() for name in TIMESLOT_NAMES}
+
+
 def parse_schedule_output(filename='schedule_output.txt'):
-    """Parse the text schedule output into structured data"""
+    """Parse the text schedule output into a list of Block records.
+
+    Reads the file one line at a time, tracking the current week, day and
+    timeslot headers; each block is emitted when its Room line is reached.
+    """
     schedule_blocks = []
+    week_num = day_idx = timeslot = None
+    subject = lecturer = group = None
     
     with open(filename, 'r') as f:
-        content = f.read()
-    
-    # Split by weeks
-    week_sections = re.split(r'WEEK (\d+)', content)
-    
-    for i in range(1, len(week_sections), 2):
-        week_num = int(week_sections[i])
-        week_content = week_sections[i + 1]
-        
-        # Split by days
-        day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
-        
-        for day_idx, day_name in enumerate(day_names, 1):
-            # Find day section
-            day_pattern = rf'{day_name}:(.*?)(?=(?:Monday:|Tuesday:|Wednesday:|Thursday:|Friday:|WEEK|\Z))'
-            day_match = re.search(day_pattern, week_content, re.DOTALL)
-            
-            if not day_match:
+        for line in f:
+            line = line.strip()
+            if not line:
                 continue
             
-            day_content = day_match.group(1)
-            
-            # Parse morning and afternoon
-            for timeslot in ['MORNING', 'AFTERNOON']:
-                timeslot_pattern = rf'{timeslot}:(.*?)(?=(?:MORNING:|AFTERNOON:|\Z))'
-                timeslot_match = re.search(timeslot_pattern, day_content, re.DOTALL)
-                
-                if not timeslot_match:
-                    continue
-                
-                timeslot_content = timeslot_match.group(1)
-                
-                # Parse individual blocks - now expects "Room #X (type)" format
-                blocks = re.findall(
-                    r'- Subject: (.*?) \((.*?)\)\s+Lecturer: (.*?)\s+Group: (.*?)\s+Room: (.*?) \((.*?)\)',
-                    timeslot_content
-                )
-                
-                for block in blocks:
-                    schedule_blocks.append({
-                        'week': week_num,
-                        'day': day_idx,
-                        'day_name': day_name,
-                        'timeslot': timeslot.lower(),
-                        'subject_name': block[0],
-                        'subject_id': block[1],
-                        'lecturer': block[2],
-                        'group': block[3],
-                        'room': block[4],  # Now contains "Room #X" format
-                        'room_type': block[5]
-                    })
+            if line in _TIMESLOT_HEADERS:
+                timeslot = _TIMESLOT_HEADERS[line]
+            elif line in _DAY_HEADERS:
+                day_idx = _DAY_HEADERS[line]
+                timeslot = None
+            elif line.startswith('- Subject: '):
+                subject = _SUBJECT_RE.match(line)
+            elif line.startswith('Lecturer: '):
+                lecturer = line[len('Lecturer: '):]
+            elif line.startswith('Group: '):
+                group = line[len('Group: '):]
+            elif line.startswith('Room: '):
+                # Parse individual blocks - expects "Room #X (type)" format
+                room = _ROOM_RE.match(line)
+                if subject and room and lecturer is not None and group is not None \
+                        and week_num is not None and day_idx and timeslot:
+                    schedule_blocks.append(Block(
+                        week_num, day_idx, DAY_NAMES[day_idx - 1], timeslot,
+                        subject.group(1), subject.group(2), lecturer, group,
+                        room.group(1),  # Now contains "Room #X" format
+                        room.group(2)))
+                subject = lecturer = group = None
+            else:
+                week_match = _WEEK_RE.match(line)
+                if week_match:
+                    week_num = int(week_match.group(1))
+                    day_idx = timeslot = None
     
     return schedule_blocks
 
 
-def create_room_calendar(schedule_blocks, weeks=15):
-    """Create a calendar view showing what's scheduled in each room"""
-    # Get unique rooms
-    rooms = sorted(set(block['room'] for block in schedule_blocks))
+# Short display forms of room and group names, computed once per name
+@lru_cache(maxsize=None)
+def group_short(group):
+    """'Group 1 - Year 1' -> 'Group 1'"""
+    return group.split('-')[0].strip()
+
+
+@lru_cache(maxsize=None)
+def room_short(room):
+    """'Room #5' -> '#5'"""
+    return room.replace('Room ', '')
+
+
+@lru_cache(maxsize=None)
+def room_two_line(room):
+    """'Room #5' -> 'Room\\n#5': first two words on separate lines"""
+    words = room.split()
+    return words[0] + '\n' + words[1] if len(words) > 1 else room
+
+
+def _save_figure(fig, path, dpi, fmt):
+    """Save fig to path as one image in format fmt.
+
+    The file is opened here with a WRITE_BUFFER-sized buffer rather than
+    letting savefig open it with the default one, so the encoded image
+    goes out in a few large writes.
+    """
+    kwargs = {'format': fmt, 'dpi': dpi, 'bbox_inches': 'tight'}
+    if fmt == 'png':
+        kwargs['pil_kwargs'] = PNG_OPTIONS
+    with open(path, 'wb', buffering=WRITE_BUFFER) as f:
+        fig.savefig(f, **kwargs)
+
+
+def new_figure(figsize):
+    """Create an empty figure on an Agg canvas, outside pyplot"""
+    # matplotlib is imported on first use so that parsing the schedule, or
+    # importing this module, does not pay for it
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+@lru_cache(maxsize=None)
+def legend_handles():
+    """Theory/practical legend handles, shared by every figure.
+
+    Handles are only templates for the legend's own artists, so one pair
+    serves every figure.
+    """
+    import matplotlib.patches as mpatches
+
+    return [
+        mpatches.Patch(color=THEORY_COLOR, label='Theory', alpha=0.7),
+        mpatches.Patch(color=PRACTICAL_COLOR, label='Practical', alpha=0.7),
+    ]
+
+
+@lru_cache(maxsize=None)
+def calendar_cells():
+    """Faint background of all 10 (day, timeslot) cells in a calendar week.
+
+    The scheduled cells are drawn over it, so no empty cell needs its own patch.
+    """
+    from matplotlib.patches import Rectangle
+
+    return [Rectangle((day_idx, 1 - slot_idx - 0.4), 0.9, 0.4)
+            for day_idx in range(5) for slot_idx in range(2)]
+
+
+def _add_cells(ax, filled, filled_colors, empty, texts):
+    """Draw calendar cells as two PatchCollections instead of one patch each.
+
+    filled are the scheduled cells, coloured by filled_colors; empty are
+    drawn faint underneath them, either the free slots or a whole background
+    grid such as calendar_cells(). texts holds (x, y, label) for the scheduled
+    cells, drawn on top in one pass with the shared CELL_TEXT_KW.
+    """
+    from matplotlib.collections import PatchCollection
+
+    if empty:
+        ax.add_collection(PatchCollection(empty, facecolor='white', edgecolor='gray',
+                                          linewidth=0.5, alpha=0.3))
+    if filled:
+        ax.add_collection(PatchCollection(filled, facecolor=filled_colors, edgecolor='black',
+                                          linewidth=1.5, alpha=0.7))
+    for x, y, label in texts:
+        ax.text(x, y, label, **CELL_TEXT_KW)
+
+
+def group_blocks(schedule_blocks):
+    """Group the blocks by room, student group and lecturer in a single pass.
+
+    Returns a namespace of three dicts (room, group, lecturer), each mapping
+    a name to its blocks in schedule order.
+    """
+    by_room, by_group, by_lecturer = defaultdict(list), defaultdict(list), defaultdict(list)
+    for block in schedule_blocks:
+        by_room[block.room].append(block)
+        by_group[block.group].append(block)
+        by_lecturer[block.lecturer].append(block)
+    return SimpleNamespace(room=by_room, group=by_group, lecturer=by_lecturer)
+
+
+def _index_by_slot(blocks):
+    """Map (week, day, timeslot) to the first of blocks scheduled in that slot"""
+    index = {}
+    for block in blocks:
+        index.setdefault((block.week, block.day, block.timeslot), block)
+    return index
+
+
+# Calendar figure reused by every calendar rendered in this (worker) process
+_calendar_fig = None
+
+
+def _calendar_figure():
+    """Return this process's 16x10 calendar figure, cleared, and its 5x3 axes.
+
+    The figure is created on first use and cleared on later calls instead of
+    being closed and reallocated for every room, group and lecturer.
+    """
+    global _calendar_fig
+    if _calendar_fig is None:
+        _calendar_fig = new_figure((16, 10))
+    else:
+        _calendar_fig.clear()
+    # clear() resets the subplot parameters, so apply the margins every time
+    _calendar_fig.subplots_adjust(**CALENDAR_LAYOUT)
+    return _calendar_fig, _calendar_fig.subplots(5, 3).flatten()
+
+
+def _render_in_parallel(render_fn, blocks_by_key, weeks, dpi, fmt, output_dir, label):
+    """Render one calendar per key of blocks_by_key across worker processes.
+
+    Each figure is independent, so
+    render_fn(key, blocks, weeks, dpi, fmt, output_dir) runs in a process
+    pool; the saved paths are printed in sorted key order.
+    """
+    keys = sorted(blocks_by_key)
+    with ProcessPoolExecutor() as pool:
+        for path in pool.map(render_fn, keys, [blocks_by_key[k] for k in keys],
+                             repeat(weeks), repeat(dpi), repeat(fmt),
+                             repeat(output_dir)):
+            print(f"✓ {label} calendar saved: {path}")
+
+
+def _render_room_calendar(room, room_blocks, weeks, dpi, fmt, output_dir):
+    """Draw and save the calendar of one room, returning the file path"""
+    from matplotlib.patches import Rectangle
+
+    slot_index = _index_by_slot(room_blocks)
     
-    # Create one figure per room
-    for room in rooms:
-        room_blocks = [b for b in schedule_blocks if b['room'] == room]
-        
-        if not room_blocks:
-            continue
-        
-        # Create figure
-        fig, axes = plt.subplots(5, 3, figsize=(16, 10))
-        fig.suptitle(f'Room Calendar: {room}', fontsize=14, fontweight='bold')
-        
-        # Flatten axes for easier indexing
-        axes = axes.flatten()
+    # Reuse this process's figure; axes come back flattened for indexing
+    fig, axes = _calendar_figure()
+    fig.suptitle(f'Room Calendar: {room}', fontsize=14, fontweight='bold')
+    
+    # Create calendar for each week
+    for week in range(1, min(weeks + 1, 16)):
+        ax = axes[week - 1]
         
-        # Create calendar for each week
-        for week in range(1, min(weeks + 1, 16)):
-            ax = axes[week - 1]
-            
-            week_blocks = [b for b in room_blocks if b['week'] == week]
-            
-            # Create a 5x2 grid (5 days, 2 timeslots)
-            days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri']
-            
-            # Draw grid
-            for day_idx in range(5):
-                for slot_idx in range(2):
-                    x = day_idx
-                    y = 1 - slot_idx  # Flip y-axis
-                    
-                    # Find block for this slot
-                    day_num = day_idx + 1
-                    timeslot = 'morning' if slot_idx == 0 else 'afternoon'
-                    
-                    block = next((b for b in week_blocks 
-                                 if b['day'] == day_num and b['timeslot'] == timeslot), None)
+        # Fill the scheduled cells of the 5x2 grid (5 days, 2 timeslots)
+        filled, filled_colors, texts = [], [], []
+        for day_idx in range(5):
+            for slot_idx in range(2):
+                x = day_idx
+                y = 1 - slot_idx  # Flip y-axis
+                
+                # Find block for this slot
+                day_num = day_idx + 1
+                timeslot = 'morning' if slot_idx == 0 else 'afternoon'
+                
+                block = slot_index.get((week, day_num, timeslot))
+                
+                if block:
+                    # Color by subject type
+                    color = ROOM_TYPE_COLORS.get(block.room_type, THEORY_COLOR)
+                    filled.append(Rectangle((x, y - 0.4), 0.9, 0.4))
+                    filled_colors.append(color)
                     
-                    if block:
-                        # Color by subject type
-                        color = '#e74c3c' if block['room_type'] == 'practical' else '#3498db'
-                        rect = Rectangle((x, y - 0.4), 0.9, 0.4, 
-                                       facecolor=color, edgecolor='black', linewidth=1.5, alpha=0.7)
-                        ax.add_patch(rect)
-                        
-                        # Add text
-                        text = f"{block['subject_id']}\n{block['group'].split('-')[0].strip()}"
-                        ax.text(x + 0.45, y - 0.2, text, 
-                               ha='center', va='center', fontsize=7, fontweight='bold')
-                    else:
-                        # Empty slot
-                        rect = Rectangle((x, y - 0.4), 0.9, 0.4,
-                                       facecolor='white', edgecolor='gray', linewidth=0.5, alpha=0.3)
-                        ax.add_patch(rect)
-            
-            # Set limits and labels
-            ax.set_xlim(-0.1, 5)
-            ax.set_ylim(-0.5, 1.5)
-            ax.set_xticks(np.arange(5) + 0.45)
-            ax.set_xticklabels(days)
-            ax.set_yticks([0.2, 0.8])
-            ax.set_yticklabels(['Afternoon', 'Morning'])
-            ax.set_title(f'Week {week}', fontweight='bold')
-            ax.grid(False)
-            ax.set_aspect('equal')
-        
-        # Hide unused subplots
-        for idx in range(weeks, len(axes)):
-            axes[idx].axis('off')
-        
-        # Add legend
-        theory_patch = mpatches.Patch(color='#3498db', label='Theory', alpha=0.7)
-        practical_patch = mpatches.Patch(color='#e74c3c', label='Practical', alpha=0.7)
-        fig.legend(handles=[theory_patch, practical_patch], 
-                  loc='lower right', fontsize=10)
+                    # Add text
+                    text = f"{block.subject_id}\n{group_short(block.group)}"
+                    texts.append((x + 0.45, y - 0.2, text))
         
-        plt.tight_layout()
+        _add_cells(ax, filled, filled_colors, calendar_cells(), texts)
         
-        # Save figure
-        room_filename = room.replace(' ', '_').replace('/', '_')
-        output_dir = os.path.join('images', 'schedule')
-        os.makedirs(output_dir, exist_ok=True)
-        path = os.path.join(output_dir, f'calendar_room_{room_filename}.png')
-        fig.savefig(path, dpi=110, bbox_inches='tight', pil_kwargs={'optimize': True})
-        print(f"✓ Room calendar saved: {path}")
-        plt.close(fig)
-
-
-def create_group_calendar(schedule_blocks, weeks=15):
-    """Create a calendar view showing each student group's schedule"""
-    # Get unique groups
-    groups = sorted(set(block['group'] for block in schedule_blocks))
-    
-    # Create one figure per group
-    for group in groups:
-        group_blocks = [b for b in schedule_blocks if b['group'] == group]
-        
-        if not group_blocks:
-            continue
-        
-        # Create figure
-        fig, axes = plt.subplots(5, 3, figsize=(16, 10))
-        fig.suptitle(f'Student Group Calendar: {group}', fontsize=14, fontweight='bold')
-        
-        # Flatten axes for easier indexing
-        axes = axes.flatten()
+        # Set limits and labels
+        ax.set_xlim(-0.1, 5)
+        ax.set_ylim(-0.5, 1.5)
+        ax.set_xticks(DAY_TICKS)
+        ax.set_xticklabels(DAYS_SHORT)
+        ax.set_yticks([0.2, 0.8])
+        ax.set_yticklabels(['Afternoon', 'Morning'])
+        ax.set_title(f'Week {week}', fontweight='bold')
+        ax.grid(False)
+    
+    # Hide unused subplots
+    for idx in range(weeks, len(axes)):
+        axes[idx].axis('off')
+    
+    # Add legend
+    fig.legend(handles=legend_handles(), 
+              loc='lower right', fontsize=10)
+    
+    # Save figure
+    room_filename = room.replace(' ', '_').replace('/', '_')
+    path = os.path.join(output_dir, f'calendar_room_{room_filename}.{fmt}')
+    _save_figure(fig, path, dpi, fmt)
+    return path
+
+
+def create_room_calendar(schedule_blocks, weeks=15, dpi=DPI, fmt='png', grouped=None,
+                         output_dir=OUTPUT_DIR):
+    """Create a calendar view showing what's scheduled in each room.
+
+    grouped is group_blocks(schedule_blocks), computed here when not given.
+    """
+    blocks_by_room = (grouped or group_blocks(schedule_blocks)).room
+    
+    # Render one figure per room in parallel
+    _render_in_parallel(_render_room_calendar, blocks_by_room, weeks, dpi, fmt, output_dir, 'Room')
+
+
+def _render_group_calendar(group, blocks_for_group, weeks, dpi, fmt, output_dir):
+    """Draw and save the calendar of one student group, returning the file path"""
+    from matplotlib.patches import Rectangle
+
+    slot_index = _index_by_slot(blocks_for_group)
+    
+    # Reuse this process's figure; axes come back flattened for indexing
+    fig, axes = _calendar_figure()
+    fig.suptitle(f'Student Group Calendar: {group}', fontsize=14, fontweight='bold')
+    
+    # Create calendar for each week
+    for week in range(1, min(weeks + 1, 16)):
+        ax = axes[week - 1]
         
-        # Create calendar for each week
-        for week in range(1, min(weeks + 1, 16)):
-            ax = axes[week - 1]
-            
-            week_blocks = [b for b in group_blocks if b['week'] == week]
-            
-            # Create a 5x2 grid (5 days, 2 timeslots)
-            days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri']
-            
-            # Draw grid
-            for day_idx in range(5):
-                for slot_idx in range(2):
-                    x = day_idx
-                    y = 1 - slot_idx  # Flip y-axis
-                    
-                    # Find block for this slot
-                    day_num = day_idx + 1
-                    timeslot = 'morning' if slot_idx == 0 else 'afternoon'
-                    
-                    block = next((b for b in week_blocks 
-                                 if b['day'] == day_num and b['timeslot'] == timeslot), None)
+        # Fill the scheduled cells of the 5x2 grid (5 days, 2 timeslots)
+        filled, filled_colors, texts = [], [], []
+        for day_idx in range(5):
+            for slot_idx in range(2):
+                x = day_idx
+                y = 1 - slot_idx  # Flip y-axis
+                
+                # Find block for this slot
+                day_num = day_idx + 1
+                timeslot = 'morning' if slot_idx == 0 else 'afternoon'
+                
+                block = slot_index.get((week, day_num, timeslot))
+                
+                if block:
+                    # Color by subject type
+                    color = ROOM_TYPE_COLORS.get(block.room_type, THEORY_COLOR)
+                    filled.append(Rectangle((x, y - 0.4), 0.9, 0.4))
+                    filled_colors.append(color)
                     
-                    if block:
-                        # Color by subject type
-                        color = '#e74c3c' if block['room_type'] == 'practical' else '#3498db'
-                        rect = Rectangle((x, y - 0.4), 0.9, 0.4, 
-                                       facecolor=color, edgecolor='black', linewidth=1.5, alpha=0.7)
-                        ax.add_patch(rect)
-                        
-                        # Show room number (e.g., "#5")
-                        room_display = block['room'].replace('Room ', '')
-                        text = f"{block['subject_id']}\n{room_display}"
-                        ax.text(x + 0.45, y - 0.2, text, 
-                               ha='center', va='center', fontsize=7, fontweight='bold')
-                    else:
-                        # Empty slot
-                        rect = Rectangle((x, y - 0.4), 0.9, 0.4,
-                                       facecolor='white', edgecolor='gray', linewidth=0.5, alpha=0.3)
-                        ax.add_patch(rect)
-            
-            # Set limits and labels
-            ax.set_xlim(-0.1, 5)
-            ax.set_ylim(-0.5, 1.5)
-            ax.set_xticks(np.arange(5) + 0.45)
-            ax.set_xticklabels(days)
-            ax.set_yticks([0.2, 0.8])
-            ax.set_yticklabels(['Afternoon', 'Morning'])
-            ax.set_title(f'Week {week}', fontweight='bold')
-            ax.grid(False)
-            ax.set_aspect('equal')
+                    # Show room number (e.g., "#5")
+                    room_display = room_short(block.room)
+                    text = f"{block.subject_id}\n{room_display}"
+                    texts.append((x + 0.45, y - 0.2, text))
         
-        # Hide unused subplots
-        for idx in range(weeks, len(axes)):
-            axes[idx].axis('off')
+        _add_cells(ax, filled, filled_colors, calendar_cells(), texts)
         
-        # Add legend
-        theory_patch = mpatches.Patch(color='#3498db', label='Theory', alpha=0.7)
-        practical_patch = mpatches.Patch(color='#e74c3c', label='Practical', alpha=0.7)
-        fig.legend(handles=[theory_patch, practical_patch], 
-                  loc='lower right', fontsize=10)
-        
-        plt.tight_layout()
-        
-        # Save figure
-        group_filename = group.replace(' ', '_').replace('-', '_')
-        output_dir = os.path.join('images', 'schedule')
-        os.makedirs(output_dir, exist_ok=True)
-        path = os.path.join(output_dir, f'calendar_group_{group_filename}.png')
-        fig.savefig(path, dpi=110, bbox_inches='tight', pil_kwargs={'optimize': True})
-        print(f"✓ Group calendar saved: {path}")
-        plt.close(fig)
+        # Set limits and labels
+        ax.set_xlim(-0.1, 5)
+        ax.set_ylim(-0.5, 1.5)
+        ax.set_xticks(DAY_TICKS)
+        ax.set_xticklabels(DAYS_SHORT)
+        ax.set_yticks([0.2, 0.8])
+        ax.set_yticklabels(['Afternoon', 'Morning'])
+        ax.set_title(f'Week {week}', fontweight='bold')
+        ax.grid(False)
+    
+    # Hide unused subplots
+    for idx in range(weeks, len(axes)):
+        axes[idx].axis('off')
+    
+    # Add legend
+    fig.legend(handles=legend_handles(), 
+              loc='lower right', fontsize=10)
+    
+    # Save figure
+    group_filename = group.replace(' ', '_').replace('-', '_')
+    path = os.path.join(output_dir, f'calendar_group_{group_filename}.{fmt}')
+    _save_figure(fig, path, dpi, fmt)
+    return path
+
 
+def create_group_calendar(schedule_blocks, weeks=15, dpi=DPI, fmt='png', grouped=None,
+                          output_dir=OUTPUT_DIR):
+    """Create a calendar view showing each student group's schedule.
 
-def create_weekly_overview(schedule_blocks, weeks_to_show=5):
+    grouped is group_blocks(schedule_blocks), computed here when not given.
+    """
+    blocks_by_group = (grouped or group_blocks(schedule_blocks)).group
+    
+    # Render one figure per group in parallel
+    _render_in_parallel(_render_group_calendar, blocks_by_group, weeks, dpi, fmt, output_dir, 'Group')
+
+
+def create_weekly_overview(schedule_blocks, weeks_to_show=5, dpi=DPI, fmt='png', output_dir=OUTPUT_DIR):
     """Create a comprehensive weekly overview showing all activities"""
+    from matplotlib.patches import Rectangle
+
+    # Group blocks by week once, keeping the first block in each slot
+    # (day, timeslot, room) of a week
+    slot_index_by_week = defaultdict(dict)
+    for block in schedule_blocks:
+        slot_index_by_week[block.week].setdefault(
+            (block.day, block.timeslot, block.room), block)
     
+    # One figure serves every week; it is cleared before each is drawn
+    fig = new_figure((16, 9))
     for week in range(1, weeks_to_show + 1):
-        week_blocks = [b for b in schedule_blocks if b['week'] == week]
+        slot_index = slot_index_by_week.get(week)
         
-        if not week_blocks:
+        if not slot_index:
             continue
         
-        # Create figure
-        fig, ax = plt.subplots(figsize=(16, 9))
+        fig.clear()
+        fig.subplots_adjust(**OVERVIEW_LAYOUT)
+        ax = fig.add_subplot()
         fig.suptitle(f'Week {week} - Complete Schedule Overview', 
                 fontsize=14, fontweight='bold')
         
         # Get unique rooms and sort them
-        rooms = sorted(set(block['room'] for block in week_blocks))
-        
-        # Create grid: days x rooms
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+        rooms = sorted(set(room for _, _, room in slot_index))
         
         # Setup grid
         y_positions = {}
@@ -283,56 +445,45 @@ def create_weekly_overview(schedule_blocks, weeks_to_show=5):
             y_positions[room] = len(rooms) - idx - 1
         
         # Draw grid and blocks
-        for day_idx, day in enumerate(days):
+        filled, filled_colors, empty, texts = [], [], [], []
+        for day_idx, day in enumerate(DAY_NAMES):
             for room_idx, room in enumerate(rooms):
                 y = y_positions[room]
                 
                 # Draw room row background
                 if day_idx == 0:
-                    ax.text(-0.5, y, room.split()[0] + '\n' + room.split()[1] if len(room.split()) > 1 else room,
+                    ax.text(-0.5, y, room_two_line(room),
                            va='center', ha='right', fontsize=8, fontweight='bold')
                 
                 # Morning slot
-                morning_block = next((b for b in week_blocks 
-                                    if b['day'] == day_idx + 1 
-                                    and b['timeslot'] == 'morning' 
-                                    and b['room'] == room), None)
+                morning_block = slot_index.get((day_idx + 1, 'morning', room))
                 
                 x_morning = day_idx * 2
                 if morning_block:
-                    color = '#e74c3c' if morning_block['room_type'] == 'practical' else '#3498db'
-                    rect = Rectangle((x_morning, y), 0.9, 0.9,
-                                   facecolor=color, edgecolor='black', linewidth=1.5, alpha=0.7)
-                    ax.add_patch(rect)
+                    color = ROOM_TYPE_COLORS.get(morning_block.room_type, THEORY_COLOR)
+                    filled.append(Rectangle((x_morning, y), 0.9, 0.9))
+                    filled_colors.append(color)
                     
-                    text = f"{morning_block['subject_id']}\n{morning_block['group'].split('-')[0].strip()}"
-                    ax.text(x_morning + 0.45, y + 0.45, text,
-                           ha='center', va='center', fontsize=7, fontweight='bold')
+                    text = f"{morning_block.subject_id}\n{group_short(morning_block.group)}"
+                    texts.append((x_morning + 0.45, y + 0.45, text))
                 else:
-                    rect = Rectangle((x_morning, y), 0.9, 0.9,
-                                   facecolor='white', edgecolor='gray', linewidth=0.5, alpha=0.3)
-                    ax.add_patch(rect)
+                    empty.append(Rectangle((x_morning, y), 0.9, 0.9))
                 
                 # Afternoon slot
-                afternoon_block = next((b for b in week_blocks 
-                                      if b['day'] == day_idx + 1 
-                                      and b['timeslot'] == 'afternoon' 
-                                      and b['room'] == room), None)
+                afternoon_block = slot_index.get((day_idx + 1, 'afternoon', room))
                 
                 x_afternoon = day_idx * 2 + 1
                 if afternoon_block:
-                    color = '#e74c3c' if afternoon_block['room_type'] == 'practical' else '#3498db'
-                    rect = Rectangle((x_afternoon, y), 0.9, 0.9,
-                                   facecolor=color, edgecolor='black', linewidth=1.5, alpha=0.7)
-                    ax.add_patch(rect)
+                    color = ROOM_TYPE_COLORS.get(afternoon_block.room_type, THEORY_COLOR)
+                    filled.append(Rectangle((x_afternoon, y), 0.9, 0.9))
+                    filled_colors.append(color)
                     
-                    text = f"{afternoon_block['subject_id']}\n{afternoon_block['group'].split('-')[0].strip()}"
-                    ax.text(x_afternoon + 0.45, y + 0.45, text,
-                           ha='center', va='center', fontsize=7, fontweight='bold')
+                    text = f"{afternoon_block.subject_id}\n{group_short(afternoon_block.group)}"
+                    texts.append((x_afternoon + 0.45, y + 0.45, text))
                 else:
-                    rect = Rectangle((x_afternoon, y), 0.9, 0.9,
-                                   facecolor='white', edgecolor='gray', linewidth=0.5, alpha=0.3)
-                    ax.add_patch(rect)
+                    empty.append(Rectangle((x_afternoon, y), 0.9, 0.9))
+        
+        _add_cells(ax, filled, filled_colors, empty, texts)
         
         # Set axis properties
         ax.set_xlim(-1, 10)
@@ -343,9 +494,8 @@ def create_weekly_overview(schedule_blocks, weeks_to_show=5):
             ax.axvline(boundary, color='lightgray', linewidth=1.0, alpha=0.8, zorder=0)
 
         # X-axis: show day names on top, one label per day
-        day_centers = [i * 2 + 0.95 for i in range(len(days))]
-        ax.set_xticks(day_centers)
-        ax.set_xticklabels(days, fontsize=9, fontweight='bold')
+        ax.set_xticks(OVERVIEW_DAY_TICKS)
+        ax.set_xticklabels(DAY_NAMES, fontsize=9, fontweight='bold')
         ax.xaxis.tick_top()
         ax.tick_params(axis='x', labelbottom=False)
 
@@ -353,170 +503,186 @@ def create_weekly_overview(schedule_blocks, weeks_to_show=5):
         ax.set_ylabel('Rooms', fontsize=12, fontweight='bold')
         
         # Add legend
-        theory_patch = mpatches.Patch(color='#3498db', label='Theory', alpha=0.7)
-        practical_patch = mpatches.Patch(color='#e74c3c', label='Practical', alpha=0.7)
-        ax.legend(handles=[theory_patch, practical_patch], 
+        ax.legend(handles=legend_handles(), 
                  loc='upper right', fontsize=10)
         
         ax.grid(False)
-        ax.set_aspect('equal')
-        
-        plt.tight_layout()
         
         # Save figure
-        output_dir = os.path.join('images', 'schedule')
-        os.makedirs(output_dir, exist_ok=True)
-        path = os.path.join(output_dir, f'calendar_week_{week}_overview.png')
-        fig.savefig(path, dpi=110, bbox_inches='tight', pil_kwargs={'optimize': True})
+        path = os.path.join(output_dir, f'calendar_week_{week}_overview.{fmt}')
+        _save_figure(fig, path, dpi, fmt)
         print(f"✓ Week {week} overview saved: {path}")
-        plt.close(fig)
 
 
-def create_utilization_heatmap(schedule_blocks, weeks=15):
+def schedule_arrays(schedule_blocks):
+    """Struct-of-arrays view of the parsed blocks, built in one conversion.
+
+    week (int16), day (int8) and slot (int8, 0 = morning, 1 = afternoon)
+    columns in block order, plus room, group and lecturer as int16 codes
+    into the sorted label lists rooms, groups and lecturers.
+    """
+    columns = {'week': [], 'day': [], 'slot': [], 'room': [], 'group': [], 'lecturer': []}
+    for b in schedule_blocks:
+        columns['week'].append(b.week)
+        columns['day'].append(b.day)
+        columns['slot'].append(b.timeslot == 'afternoon')
+        columns['room'].append(b.room)
+        columns['group'].append(b.group)
+        columns['lecturer'].append(b.lecturer)
+    
+    arrays = SimpleNamespace(
+        week=np.array(columns['week'], dtype=np.int16),
+        day=np.array(columns['day'], dtype=np.int8),
+        slot=np.array(columns['slot'], dtype=np.int8),
+    )
+    for key, labels_attr in (('room', 'rooms'), ('group', 'groups'), ('lecturer', 'lecturers')):
+        labels, codes = np.unique(np.array(columns[key], dtype=str), return_inverse=True)
+        setattr(arrays, labels_attr, labels.tolist())
+        setattr(arrays, key, codes.astype(np.int16))
+    return arrays
+
+
+def _count_per_week(week, codes, n_labels, weeks):
+    """Count blocks per (week, label code) in one pass; returns a weeks x n_labels array.
+
+    Blocks scheduled after the last shown week are left out.
+    """
+    shown = (week >= 1) & (week <= weeks)
+    counts = np.zeros((weeks, n_labels))
+    np.add.at(counts, (week[shown] - 1, codes[shown]), 1)
+    return counts
+
+
+def create_utilization_heatmap(schedule_blocks, weeks=15, dpi=DPI, fmt='png', output_dir=OUTPUT_DIR):
     """Create heatmaps showing room and group utilization"""
+    arrays = schedule_arrays(schedule_blocks)
     
-    fig, axes = plt.subplots(1, 2, figsize=(14, 7))
+    fig = new_figure((14, 7))
+    fig.subplots_adjust(**HEATMAP_LAYOUT)
+    axes = fig.subplots(1, 2)
     fig.suptitle('Utilization Analysis', fontsize=14, fontweight='bold')
     
     # Room utilization heatmap
     ax = axes[0]
-    rooms = sorted(set(block['room'] for block in schedule_blocks))
+    rooms = arrays.rooms
     
     # Create matrix: weeks x rooms
-    room_utilization = np.zeros((weeks, len(rooms)))
-    
-    for week in range(1, weeks + 1):
-        for room_idx, room in enumerate(rooms):
-            # Count blocks for this room in this week
-            count = len([b for b in schedule_blocks 
-                        if b['week'] == week and b['room'] == room])
-            room_utilization[week - 1, room_idx] = count
+    room_utilization = _count_per_week(arrays.week, arrays.room, len(rooms), weeks)
     
     im = ax.imshow(room_utilization, cmap='YlOrRd', aspect='auto')
     ax.set_title('Room Utilization per Week', fontsize=12, fontweight='bold')
     ax.set_xlabel('Room')
     ax.set_ylabel('Week')
     ax.set_xticks(range(len(rooms)))
-    ax.set_xticklabels([r.split()[0] + '\n' + r.split()[1] if len(r.split()) > 1 else r 
-                        for r in rooms], fontsize=7, rotation=45, ha='right')
+    ax.set_xticklabels([room_two_line(r) for r in rooms], fontsize=7, rotation=45, ha='right')
     ax.set_yticks(range(0, weeks, 2))
     ax.set_yticklabels(range(1, weeks + 1, 2))
     
     # Add colorbar
-    cbar = plt.colorbar(im, ax=ax)
+    cbar = fig.colorbar(im, ax=ax)
     cbar.set_label('Number of Blocks', rotation=270, labelpad=15)
     
     # Omit per-cell value annotations to reduce render time and file size
     
     # Group utilization heatmap
     ax = axes[1]
-    groups = sorted(set(block['group'] for block in schedule_blocks))
+    groups = arrays.groups
     
     # Create matrix: weeks x groups
-    group_utilization = np.zeros((weeks, len(groups)))
-    
-    for week in range(1, weeks + 1):
-        for group_idx, group in enumerate(groups):
-            # Count blocks for this group in this week
-            count = len([b for b in schedule_blocks 
-                        if b['week'] == week and b['group'] == group])
-            group_utilization[week - 1, group_idx] = count
+    group_utilization = _count_per_week(arrays.week, arrays.group, len(groups), weeks)
     
     im = ax.imshow(group_utilization, cmap='YlGnBu', aspect='auto')
     ax.set_title('Student Group Utilization per Week', fontsize=12, fontweight='bold')
     ax.set_xlabel('Student Group')
     ax.set_ylabel('Week')
     ax.set_xticks(range(len(groups)))
-    ax.set_xticklabels([g.split('-')[0].strip() for g in groups], fontsize=8)
+    ax.set_xticklabels([group_short(g) for g in groups], fontsize=8)
     ax.set_yticks(range(0, weeks, 2))
     ax.set_yticklabels(range(1, weeks + 1, 2))
     
     # Add colorbar
-    cbar = plt.colorbar(im, ax=ax)
+    cbar = fig.colorbar(im, ax=ax)
     cbar.set_label('Number of Blocks', rotation=270, labelpad=15)
     
     # Omit per-cell value annotations to reduce render time and file size
     
-    plt.tight_layout()
-    output_dir = os.path.join('images', 'schedule')
-    os.makedirs(output_dir, exist_ok=True)
-    path = os.path.join(output_dir, 'calendar_utilization_heatmap.png')
-    fig.savefig(path, dpi=110, bbox_inches='tight', pil_kwargs={'optimize': True})
+    path = os.path.join(output_dir, f'calendar_utilization_heatmap.{fmt}')
+    _save_figure(fig, path, dpi, fmt)
     print(f"✓ Utilization heatmap saved: {path}")
-    plt.close(fig)
 
 
-def create_lecturer_calendar(schedule_blocks, weeks=15):
-    """Create a calendar view showing each lecturer's schedule"""
-    lecturers = sorted(set(block['lecturer'] for block in schedule_blocks))
+def _render_lecturer_calendar(lecturer, lec_blocks, weeks, dpi, fmt, output_dir):
+    """Draw and save the calendar of one lecturer, returning the file path"""
+    from matplotlib.patches import Rectangle
 
-    for lecturer in lecturers:
-        lec_blocks = [b for b in schedule_blocks if b['lecturer'] == lecturer]
-        if not lec_blocks:
-            continue
+    slot_index = _index_by_slot(lec_blocks)
 
-        fig, axes = plt.subplots(5, 3, figsize=(16, 10))
-        fig.suptitle(f'Lecturer Calendar: {lecturer}', fontsize=14, fontweight='bold')
-        axes = axes.flatten()
-
-        for week in range(1, min(weeks + 1, 16)):
-            ax = axes[week - 1]
-            week_blocks = [b for b in lec_blocks if b['week'] == week]
-
-            days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri']
-
-            for day_idx in range(5):
-                for slot_idx in range(2):
-                    x = day_idx
-                    y = 1 - slot_idx
-                    day_num = day_idx + 1
-                    timeslot = 'morning' if slot_idx == 0 else 'afternoon'
-                    block = next((b for b in week_blocks if b['day'] == day_num and b['timeslot'] == timeslot), None)
-
-                    if block:
-                        color = '#e74c3c' if block['room_type'] == 'practical' else '#3498db'
-                        rect = Rectangle((x, y - 0.4), 0.9, 0.4,
-                                         facecolor=color, edgecolor='black', linewidth=1.5, alpha=0.7)
-                        ax.add_patch(rect)
-                        # Show room number (e.g., "#5")
-                        room_display = block['room'].replace('Room ', '')
-                        text = f"{block['subject_id']}\n{room_display}"
-                        ax.text(x + 0.45, y - 0.2, text, ha='center', va='center', fontsize=7, fontweight='bold')
-                    else:
-                        rect = Rectangle((x, y - 0.4), 0.9, 0.4,
-                                         facecolor='white', edgecolor='gray', linewidth=0.5, alpha=0.3)
-                        ax.add_patch(rect)
-
-            # Set limits and labels
-            ax.set_xlim(-0.1, 5)
-            ax.set_ylim(-0.5, 1.5)
-            ax.set_xticks(np.arange(5) + 0.45)
-            ax.set_xticklabels(days)
-            ax.set_yticks([0.2, 0.8])
-            ax.set_yticklabels(['Afternoon', 'Morning'])
-            ax.set_title(f'Week {week}', fontweight='bold')
-            ax.grid(False)
-            ax.set_aspect('equal')
-
-        for idx in range(weeks, len(axes)):
-            axes[idx].axis('off')
-
-        theory_patch = mpatches.Patch(color='#3498db', label='Theory', alpha=0.7)
-        practical_patch = mpatches.Patch(color='#e74c3c', label='Practical', alpha=0.7)
-        fig.legend(handles=[theory_patch, practical_patch], loc='lower right', fontsize=10)
-
-        plt.tight_layout()
-
-        lec_filename = lecturer.replace(' ', '_').replace('-', '_')
-        output_dir = os.path.join('images', 'schedule')
-        os.makedirs(output_dir, exist_ok=True)
-        path = os.path.join(output_dir, f'calendar_lecturer_{lec_filename}.png')
-        fig.savefig(path, dpi=110, bbox_inches='tight', pil_kwargs={'optimize': True})
-        print(f"✓ Lecturer calendar saved: {path}")
-        plt.close(fig)
-
-def main():
-    """Main function to generate all calendar visualizations"""
+    fig, axes = _calendar_figure()
+    fig.suptitle(f'Lecturer Calendar: {lecturer}', fontsize=14, fontweight='bold')
+
+    for week in range(1, min(weeks + 1, 16)):
+        ax = axes[week - 1]
+
+        filled, filled_colors, texts = [], [], []
+        for day_idx in range(5):
+            for slot_idx in range(2):
+                x = day_idx
+                y = 1 - slot_idx
+                day_num = day_idx + 1
+                timeslot = 'morning' if slot_idx == 0 else 'afternoon'
+                block = slot_index.get((week, day_num, timeslot))
+
+                if block:
+                    color = ROOM_TYPE_COLORS.get(block.room_type, THEORY_COLOR)
+                    filled.append(Rectangle((x, y - 0.4), 0.9, 0.4))
+                    filled_colors.append(color)
+                    # Show room number (e.g., "#5")
+                    room_display = room_short(block.room)
+                    text = f"{block.subject_id}\n{room_display}"
+                    texts.append((x + 0.45, y - 0.2, text))
+
+        _add_cells(ax, filled, filled_colors, calendar_cells(), texts)
+
+        # Set limits and labels
+        ax.set_xlim(-0.1, 5)
+        ax.set_ylim(-0.5, 1.5)
+        ax.set_xticks(DAY_TICKS)
+        ax.set_xticklabels(DAYS_SHORT)
+        ax.set_yticks([0.2, 0.8])
+        ax.set_yticklabels(['Afternoon', 'Morning'])
+        ax.set_title(f'Week {week}', fontweight='bold')
+        ax.grid(False)
+
+    for idx in range(weeks, len(axes)):
+        axes[idx].axis('off')
+
+    fig.legend(handles=legend_handles(), loc='lower right', fontsize=10)
+
+    lec_filename = lecturer.replace(' ', '_').replace('-', '_')
+    path = os.path.join(output_dir, f'calendar_lecturer_{lec_filename}.{fmt}')
+    _save_figure(fig, path, dpi, fmt)
+    return path
+
+
+def create_lecturer_calendar(schedule_blocks, weeks=15, dpi=DPI, fmt='png', grouped=None,
+                             output_dir=OUTPUT_DIR):
+    """Create a calendar view showing each lecturer's schedule.
+
+    grouped is group_blocks(schedule_blocks), computed here when not given.
+    """
+    blocks_by_lecturer = (grouped or group_blocks(schedule_blocks)).lecturer
+
+    _render_in_parallel(_render_lecturer_calendar, blocks_by_lecturer, weeks, dpi, fmt, output_dir, 'Lecturer')
+
+
+def main(fast=False, fmt='png'):
+    """Main function to generate all calendar visualizations.
+
+    fast=True (``--fast`` on the command line) renders at FAST_DPI.
+    fmt='svg' (``--svg``) writes vector SVG files instead of PNGs; they skip
+    rasterization and zlib encoding, and can be rasterized later if needed.
+    """
+    dpi = FAST_DPI if fast else DPI
     print("="*60)
     print("SCHEDULE CALENDAR VISUALIZATION")
     print("="*60)
@@ -525,21 +691,26 @@ def main():
     schedule_blocks = parse_schedule_output()
     print(f"✓ Parsed {len(schedule_blocks)} scheduled blocks")
     
+    grouped = group_blocks(schedule_blocks)
+    # Every image goes to the same directory, so create it once up front
+    output_dir = OUTPUT_DIR
+    os.makedirs(output_dir, exist_ok=True)
+    
     print("\nGenerating visualizations...")
     print("\n1. Room Calendars:")
-    create_room_calendar(schedule_blocks, weeks=15)
+    create_room_calendar(schedule_blocks, weeks=15, dpi=dpi, fmt=fmt, grouped=grouped, output_dir=output_dir)
     
     print("\n2. Student Group Calendars:")
-    create_group_calendar(schedule_blocks, weeks=15)
+    create_group_calendar(schedule_blocks, weeks=15, dpi=dpi, fmt=fmt, grouped=grouped, output_dir=output_dir)
 
     print("\n3. Lecturer Calendars:")
-    create_lecturer_calendar(schedule_blocks, weeks=15)
+    create_lecturer_calendar(schedule_blocks, weeks=15, dpi=dpi, fmt=fmt, grouped=grouped, output_dir=output_dir)
     
     print("\n4. Weekly Overviews:")
-    create_weekly_overview(schedule_blocks, weeks_to_show=5)
+    create_weekly_overview(schedule_blocks, weeks_to_show=5, dpi=dpi, fmt=fmt, output_dir=output_dir)
     
     print("\n5. Utilization Analysis:")
-    create_utilization_heatmap(schedule_blocks, weeks=15)
+    create_utilization_heatmap(schedule_blocks, weeks=15, dpi=dpi, fmt=fmt, output_dir=output_dir)
     
     print("\n" + "="*60)
     print("All calendar visualizations generated successfully!")
@@ -547,4 +718,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(fast='--fast' in sys.argv[1:], fmt='svg' if '--svg' in sys.argv[1:] else 'png')